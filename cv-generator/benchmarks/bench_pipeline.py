@@ -0,0 +1,274 @@
+"""
+Benchmark suite for the stages of the CV pipeline in create_cv.py.
+
+For each size a synthetic repository is generated (components/*.tsx with that
+many experiences, skill categories and projects, plus the real logos) and
+every stage is timed on it:
+
+    extract_content_from_repo  reading the components and syncing logos
+    extract (cached)           the same with every component in cv-data.json
+    extract_tsx_data           parsing the experiences array
+    parse_tsx_object           parsing each experience object on its own
+    translate (cold/cached)    translate_batch with a local stub translator
+    render (python-docx/fast)  build_document in both render modes
+    doc.save / write_docx      writing the .docx package
+
+Results are saved as JSON (by default in .cache/benchmarks/) and compared
+with a baseline, by default the previous result. Stages that got slower than
+the threshold are reported and make the script exit with status 1.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 10,100,1000] [--repeat 3]
+                                        [--baseline FILE] [--threshold 0.25]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import create_cv
+from create_cv import (CACHE_DIR, LOGO_FILES, REPO_ROOT, SCRIPT_DIR, CVData, RenderInputs,
+                       TranslationCache, build_document, extract_content_from_repo,
+                       extract_tsx_data, parse_tsx_object, translate_batch, write_docx)
+from bench_tsx_parser import build_experience_tsx
+
+RESULTS_VERSION = 1
+RESULTS_DIR = os.path.join(CACHE_DIR, 'benchmarks')
+
+# Differences below this many seconds are noise, not regressions
+MIN_REGRESSION_SECONDS = 0.002
+
+
+class StubTranslator:
+    """
+    Local stand-in for GoogleTranslator with an optional per-call delay.
+    """
+
+    def __init__(self, target_lang: str, delay: float = 0.0):
+        self.target_lang = target_lang
+        self.delay = delay
+
+    def translate(self, text: str) -> str:
+        if self.delay:
+            time.sleep(self.delay)
+        return f"[{self.target_lang}] {text}"
+
+
+def build_hero_tsx() -> str:
+    return (
+        "export default function Hero() {\n"
+        "  return (\n"
+        "    <section>\n"
+        "      <p className=\"text-xl md:text-2xl mb-6\">\n"
+        "        Datacenter Manager • Open Source-expert • Entreprenör\n"
+        "      </p>\n"
+        "      <p className=\"max-w-2xl mx-auto text-lg mb-8 px-4\">\n"
+        + "        Resultatorienterad och driven personlighet med passion för automation.\n" * 5
+        + "      </p>\n"
+        "    </section>\n"
+        "  );\n"
+        "}\n"
+    )
+
+
+def build_skills_tsx(categories: int) -> str:
+    items = ''.join(
+        "    {\n"
+        f"      title: 'Kompetensområde {i}',\n"
+        "      skills: ['VMware vSphere/ESX', 'Nutanix AHV', 'Hyper-V', 'Proxmox VE'],\n"
+        "    },\n"
+        for i in range(categories)
+    )
+    return f"export default function Skills() {{\n  const skillCategories: SkillCategoryProps[] = [\n{items}  ];\n}}\n"
+
+
+def build_projects_tsx(projects: int) -> str:
+    items = ''.join(
+        "    {\n"
+        f"      title: 'Projekt {i}',\n"
+        "      description: 'Interaktiva skript som tar dig från ren server till A+ TLS-härdad instans.',\n"
+        "      stars: '1.5k',\n"
+        "      links: [\n"
+        "        { text: 'GitHub →', url: 'https://github.com/nextcloud/vm' },\n"
+        "      ],\n"
+        "    },\n"
+        for i in range(projects)
+    )
+    return f"export default function Projects() {{\n  const projects: ProjectCardProps[] = [\n{items}  ];\n}}\n"
+
+
+def build_repository(root: str, size: int):
+    """
+    Write a synthetic repository with `size` experiences, skill categories and projects.
+    """
+    components = os.path.join(root, 'components')
+    public = os.path.join(root, 'public')
+    os.makedirs(components)
+    os.makedirs(public)
+    files = {
+        'Hero.tsx': build_hero_tsx(),
+        'Experience.tsx': build_experience_tsx(size),
+        'Skills.tsx': build_skills_tsx(size),
+        'Projects.tsx': build_projects_tsx(size)
+    }
+    for name, content in files.items():
+        with open(os.path.join(components, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+    for logo_file in LOGO_FILES.values():
+        shutil.copyfile(os.path.join(REPO_ROOT, 'public', logo_file), os.path.join(public, logo_file))
+    return files
+
+
+def best_of(repeat: int, func, setup=None) -> float:
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_size(size: int, repeat: int, translator_delay: float, workdir: str) -> dict:
+    root = os.path.join(workdir, f'repo-{size}')
+    files = build_repository(root, size)
+    experience_tsx = files['Experience.tsx']
+    translator_factory = lambda source, target: StubTranslator(target, translator_delay)
+    results = {}
+
+    # The stages print progress lines, which are not part of what is measured
+    with contextlib.redirect_stdout(io.StringIO()):
+        results['extract_content_from_repo'] = best_of(
+            repeat, lambda: extract_content_from_repo(root, cache_path=None))
+        cv_data_path = os.path.join(workdir, f'cv-data-{size}.json')
+        extract_content_from_repo(root, cache_path=cv_data_path)
+        results['extract (cached)'] = best_of(
+            repeat, lambda: extract_content_from_repo(root, cache_path=cv_data_path))
+        results['extract_tsx_data'] = best_of(repeat, lambda: extract_tsx_data(experience_tsx, 'experiences'))
+
+        object_strings = experience_tsx.split('  const experiences: ExperienceItemProps[] = [\n')[1]
+        object_strings = [item.rstrip(',\n') for item in object_strings.split('    },\n')[:-1]]
+        object_strings = [item + '    }' for item in object_strings]
+        results['parse_tsx_object'] = best_of(repeat, lambda: [parse_tsx_object(item) for item in object_strings])
+
+        texts = [f'Kompetensområde {i}' for i in range(size)] + ['Resultatorienterad och driven personlighet. ' * 20]
+        cache_path = os.path.join(workdir, f'translations-{size}.json')
+
+        def reset_cache():
+            create_cv.translation_cache = TranslationCache(path=cache_path)
+            create_cv.translation_cache.enabled = False
+            create_cv.translation_breaker.reset()
+        results['translate (cold)'] = best_of(
+            repeat, lambda: translate_batch(texts, translator_factory=translator_factory), reset_cache)
+
+        create_cv.translation_cache = TranslationCache(path=cache_path)
+        translate_batch(texts, translator_factory=translator_factory)
+        results['translate (cached)'] = best_of(
+            repeat, lambda: translate_batch(texts, translator_factory=translator_factory))
+
+        data = CVData(root, translator_factory=translator_factory, cache_path=cv_data_path)
+        content = data.for_language('sv')
+        inputs = RenderInputs(os.path.join(SCRIPT_DIR, 'mall-kronologiskt-cv-251020-variant.docx'),
+                              os.path.join(SCRIPT_DIR, 'profile_pic.jpg'), data.company_logos)
+        inputs.template.document
+        results['render (python-docx)'] = best_of(repeat, lambda: build_document(inputs, content, 'sv'))
+        results['render (fast)'] = best_of(repeat, lambda: build_document(inputs, content, 'sv', fast=True))
+
+        doc = build_document(inputs, content, 'sv', fast=True)
+        results['doc.save'] = best_of(repeat, lambda: doc.save(io.BytesIO()))
+        results['write_docx'] = best_of(repeat, lambda: write_docx(doc, io.BytesIO()))
+
+    return results
+
+
+def latest_result(exclude: str = None):
+    paths = sorted(path for path in glob.glob(os.path.join(RESULTS_DIR, 'bench-*.json')) if path != exclude)
+    return paths[-1] if paths else None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Return (size, stage, baseline seconds, seconds) for every stage that got
+    slower than the threshold allows.
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, seconds in stages.items():
+            before = baseline.get(size, {}).get(stage)
+            if before is None:
+                continue
+            if seconds > before * (1 + threshold) and seconds - before > MIN_REGRESSION_SECONDS:
+                regressions.append((size, stage, before, seconds))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the stages of the CV pipeline on synthetic inputs')
+    parser.add_argument('--sizes', default='10,100,1000',
+                        help='Comma-separated numbers of experiences, skill categories and projects')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs per stage (best is kept)')
+    parser.add_argument('--translator-delay', type=float, default=0.0,
+                        help='Seconds the stub translator sleeps per call, to simulate network latency')
+    parser.add_argument('--output', help='Where to save the JSON results (default: .cache/benchmarks/bench-<time>.json)')
+    parser.add_argument('--baseline', help='Results to compare with (default: the previous results)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown reported as a regression (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    output_path = args.output or os.path.join(RESULTS_DIR, time.strftime('bench-%Y%m%dT%H%M%S.json'))
+    baseline_path = args.baseline or latest_result(exclude=output_path)
+
+    results = {}
+    workdir = tempfile.mkdtemp(prefix='cv-bench-')
+    try:
+        for size in sizes:
+            print(f"\n⏱  Size {size}")
+            results[str(size)] = bench_size(size, args.repeat, args.translator_delay, workdir)
+            for stage, seconds in results[str(size)].items():
+                print(f"  {stage:<28} {seconds * 1000:10.1f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'translator_delay': args.translator_delay,
+            'results': results
+        }, f, indent=2)
+    print(f"\n✓ Results saved to {output_path}")
+
+    if not baseline_path:
+        return
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != RESULTS_VERSION:
+        print(f"⚠ Ignoring baseline {baseline_path} with another results version")
+        return
+    regressions = compare(results, baseline['results'], args.threshold)
+    if not regressions:
+        print(f"✓ No regressions beyond {args.threshold:.0%} against {baseline_path}")
+        return
+    print(f"⚠ {len(regressions)} regressions beyond {args.threshold:.0%} against {baseline_path}:")
+    for size, stage, before, seconds in regressions:
+        print(f"  size {size}, {stage}: {before * 1000:.1f} ms → {seconds * 1000:.1f} ms ({seconds / before - 1:+.0%})")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
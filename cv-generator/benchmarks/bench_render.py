@@ -0,0 +1,144 @@
+"""
+Benchmark of document rendering in create_cv.py: python-docx objects
+(add_body) against the one-pass XML body writer (write_body_xml).
+
+Builds a large synthetic CV with the real template, profile picture and
+company logos and times build_document() in both modes, and the fast mode
+with a warm section cache after one job changed. Saving the document is the
+same in both modes and is timed separately: doc.save() against write_docx()
+at a few deflate levels, with the size of the written package. Finally the
+reproducible package of a document rendered with a cold and with a warm
+section cache is checked to be byte-identical.
+
+Usage:
+    python benchmarks/bench_render.py [--jobs 500] [--repeat 3]
+"""
+import argparse
+import copy
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from create_cv import (DOCX_DEFLATE_LEVEL, LANGUAGES, LOGO_FILES, REPO_ROOT, REPRODUCIBLE_EPOCH, SCRIPT_DIR,
+                       RenderInputs, SectionCache, build_document, write_docx, education_english, certificates_english,
+                       languages_english, key_competencies_english)
+
+
+def build_content(jobs: int) -> dict:
+    """
+    Build English CV content with `jobs` work experience entries, cycling
+    through the companies that have logos.
+    """
+    companies = list(LOGO_FILES) + ['Company Without Logo AB']
+    work_experience = []
+    for i in range(jobs):
+        work_experience.append({
+            'title': f'Systems Administrator {i}',
+            'company': companies[i % len(companies)],
+            'location': 'Malmö',
+            'date': 'Jan 2020 - Present',
+            'description': ("Managed Linux environments, on-call and automation. "
+                            "Drove migration projects between hypervisors.\nLed a team of engineers."),
+            'keywords': 'Linux, VMware vSphere, Ansible, Bash',
+            'page_break_before': i % 50 == 49
+        })
+    return {
+        'profile_header': 'Datacenter Manager • Open Source Expert',
+        'profile_text': 'Results-oriented and driven. ' * 20,
+        'key_competencies': key_competencies_english * 10,
+        'it_skills': {f'Category {i}': 'Linux, Windows Server, Docker, PostgreSQL' for i in range(jobs // 10 + 1)},
+        'work_experience': work_experience,
+        'education': education_english * 10,
+        'certificates': certificates_english * 10,
+        'projects': [{'name': f'Project {i}', 'desc': 'Open source tooling & automation <scripts>'}
+                     for i in range(jobs // 5 + 1)],
+        'languages': languages_english
+    }
+
+
+def time_build(inputs, content, fast: bool, repeat: int, cache=None):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        doc = build_document(inputs, content, 'en', fast=fast, cache=cache)
+        timings.append(time.perf_counter() - start)
+    return min(timings), doc
+
+
+def time_save(save, repeat: int):
+    """
+    Return the best time of save(stream) and the number of bytes it wrote.
+    """
+    timings = []
+    for _ in range(repeat):
+        stream = io.BytesIO()
+        start = time.perf_counter()
+        save(stream)
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(stream.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark build_document with and without the fast body writer')
+    parser.add_argument('--jobs', type=int, default=500, help='Number of synthetic work experience entries')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs per mode')
+    args = parser.parse_args()
+
+    logos = {company: os.path.join(REPO_ROOT, 'public', logo_file) for company, logo_file in LOGO_FILES.items()}
+    inputs = RenderInputs(os.path.join(SCRIPT_DIR, 'mall-kronologiskt-cv-251020-variant.docx'),
+                          os.path.join(SCRIPT_DIR, 'profile_pic.jpg'), logos)
+    content = build_content(args.jobs)
+    # Warm up the prepared template shared by both modes
+    inputs.template.document
+
+    classic, classic_doc = time_build(inputs, content, False, args.repeat)
+    fast, fast_doc = time_build(inputs, content, True, args.repeat)
+
+    # With a warm section cache, unchanged and with one job edited (only Work Experience is written again)
+    cache = SectionCache(path=os.path.join(tempfile.mkdtemp(prefix='cv-bench-'), 'sections.json'))
+    build_document(inputs, content, 'en', fast=True, cache=cache)
+    cached, _ = time_build(inputs, content, True, args.repeat, cache)
+    edits = []
+    for i in range(args.repeat):
+        edited = copy.deepcopy(content)
+        edited['work_experience'][0]['description'] += f' Edit {i}.'
+        start = time.perf_counter()
+        edited_doc = build_document(inputs, edited, 'en', fast=True, cache=cache)
+        edits.append(time.perf_counter() - start)
+    assert [p.text for p in edited_doc.paragraphs] == [p.text for p in build_document(inputs, edited, 'en').paragraphs]
+
+    paragraphs = len(classic_doc.paragraphs)
+    assert len(fast_doc.paragraphs) == paragraphs, f"fast render wrote {len(fast_doc.paragraphs)} of {paragraphs} paragraphs"
+    assert [p.text for p in fast_doc.paragraphs] == [p.text for p in classic_doc.paragraphs]
+
+    saves = [('doc.save', time_save(fast_doc.save, args.repeat))]
+    for level in sorted({1, DOCX_DEFLATE_LEVEL, 9}):
+        saves.append((f'write_docx, level {level}',
+                      time_save(lambda stream: write_docx(fast_doc, stream, level), args.repeat)))
+
+    digests = set()
+    for doc in (fast_doc, build_document(inputs, content, 'en', fast=True, cache=cache)):
+        stream = io.BytesIO()
+        write_docx(doc, stream, build_date=REPRODUCIBLE_EPOCH)
+        digests.add(hashlib.sha256(stream.getvalue()).hexdigest())
+    assert len(digests) == 1, "reproducible packages of the same content differ"
+
+    print(f"build_document: {args.jobs} jobs, {paragraphs} paragraphs ({LANGUAGES['en']['output']})")
+    print(f"  python-docx objects: {classic * 1000:.1f} ms")
+    print(f"  fast body writer:    {fast * 1000:.1f} ms ({classic / fast:.1f}x faster)")
+    print(f"  fast, section cache: {cached * 1000:.1f} ms unchanged, {min(edits) * 1000:.1f} ms with one job edited")
+    print("saving (either mode):")
+    save, size = saves[0][1]
+    for name, (seconds, written) in saves:
+        print(f"  {name + ':':<21}{seconds * 1000:.1f} ms, {written / 1024:.0f} KB "
+              f"({save / seconds:.1f}x faster, {written / size - 1:+.1%} size)")
+    print("  reproducible:        identical bytes with a cold and a warm section cache")
+
+
+if __name__ == '__main__':
+    main()
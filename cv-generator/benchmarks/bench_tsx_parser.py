@@ -0,0 +1,73 @@
+"""
+Micro-benchmark for the TSX object-literal parser in create_cv.py.
+
+Builds a synthetic Experience.tsx with a large `experiences` array and times
+extract_tsx_data() on it.
+
+Usage:
+    python benchmarks/bench_tsx_parser.py [--entries 10000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from create_cv import extract_tsx_data
+
+
+def build_experience_tsx(entries: int) -> str:
+    """
+    Build a component file shaped like components/Experience.tsx with `entries` jobs.
+    """
+    items = []
+    for i in range(entries):
+        items.append(
+            "    {\n"
+            f"      title: 'Systemadministratör {i}',\n"
+            f"      company: \"Företag {i} AB\",\n"
+            "      period: 'Jan 2020 - Nuvarande',\n"
+            "      location: 'Malmö',\n"
+            "      // Quotes of the other kind must not end the string\n"
+            "      description: \"Förvaltade Linux-miljöer, 'on-call' och automation. "
+            "Drev migreringsprojekt mellan hypervisors.\\n\\nLedde team.\",\n"
+            "      skills: ['Linux', 'VMware vSphere', `Ansible`, 'Bash'],\n"
+            "      logo: '/infracom-logo.png',\n"
+            f"      highlight: {'true' if i % 2 else 'false'},\n"
+            "    },\n"
+        )
+    return (
+        "export default function Experience() {\n"
+        "  const experiences: ExperienceItemProps[] = [\n"
+        + ''.join(items)
+        + "  ];\n"
+        "}\n"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark extract_tsx_data on a synthetic experiences array')
+    parser.add_argument('--entries', type=int, default=10000, help='Number of synthetic experiences')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs')
+    args = parser.parse_args()
+
+    content = build_experience_tsx(args.entries)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        items = extract_tsx_data(content, 'experiences')
+        timings.append(time.perf_counter() - start)
+
+    assert len(items) == args.entries, f"parsed {len(items)} of {args.entries} entries"
+    assert items[0]['description'].count("'") == 2
+
+    best = min(timings)
+    size_mb = len(content.encode('utf-8')) / (1024 * 1024)
+    print(f"extract_tsx_data: {args.entries} entries, {size_mb:.1f} MB")
+    print(f"  best {best * 1000:.1f} ms, mean {sum(timings) / len(timings) * 1000:.1f} ms over {args.repeat} runs")
+    print(f"  {args.entries / best:,.0f} entries/s, {size_mb / best:.1f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
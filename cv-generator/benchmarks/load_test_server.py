@@ -0,0 +1,127 @@
+"""
+Load test for the --serve HTTP render service in create_cv.py.
+
+By default a service is started in this process on a free port, with a local
+stub translator, and hit by concurrent keep-alive clients requesting random
+languages. Part of the requests revalidate with If-None-Match, like a browser
+or download tool that already has the document. The in-process service keeps
+its translation, cv-data and section caches in a temporary directory, so the
+stub translations never reach the caches of real runs. Pass --url to test a
+server started separately (python create_cv.py --serve), which keeps the
+clients from competing with the server for this process.
+
+Usage:
+    python benchmarks/load_test_server.py [--requests 2000] [--concurrency 8]
+                                          [--revalidate 0.5] [--url http://127.0.0.1:8000]
+"""
+import argparse
+import http.client
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import create_cv
+from create_cv import (LANGUAGES, SCRIPT_DIR, CVData, RenderService, SectionCache, TranslationCache,
+                       WarmInputs, make_server)
+from bench_pipeline import StubTranslator
+
+
+def start_service(fast: bool, workdir: str):
+    create_cv.translation_cache = TranslationCache(path=os.path.join(workdir, 'translations.json'))
+    create_cv.section_cache = SectionCache(path=os.path.join(workdir, 'sections.json'))
+    data = CVData(translator_factory=lambda source, target: StubTranslator(target),
+                  cache_path=os.path.join(workdir, 'cv-data.json'))
+    state = WarmInputs(data, os.path.join(SCRIPT_DIR, 'mall-kronologiskt-cv-251020-variant.docx'),
+                       os.path.join(SCRIPT_DIR, 'profile_pic.jpg'))
+    state.render_inputs.template.document
+    service = RenderService(state, fast=fast)
+    server = make_server(service, '127.0.0.1', 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return service, server, f"http://127.0.0.1:{server.server_port}"
+
+
+def client(url: str, requests: int, revalidate: float, seed: int, results: list):
+    """
+    Send requests over one keep-alive connection, recording (status, seconds, bytes).
+    """
+    rng = random.Random(seed)
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    etags = {}
+    for _ in range(requests):
+        language = rng.choice(list(LANGUAGES))
+        headers = {}
+        if language in etags and rng.random() < revalidate:
+            headers['If-None-Match'] = etags[language]
+        start = time.perf_counter()
+        connection.request('GET', f"/cv?lang={language}", headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        elapsed = time.perf_counter() - start
+        if response.getheader('ETag'):
+            etags[language] = response.getheader('ETag')
+        results.append((response.status, elapsed, len(body)))
+    connection.close()
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the CV render service')
+    parser.add_argument('--url', help='Base URL of a running server (default: start one in this process)')
+    parser.add_argument('--requests', type=int, default=2000, help='Total number of requests')
+    parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent clients')
+    parser.add_argument('--revalidate', type=float, default=0.5,
+                        help='Share of repeat requests sent with If-None-Match')
+    parser.add_argument('--fast', action='store_true', help='Render with the fast body writer (in-process server)')
+    args = parser.parse_args()
+
+    service = server = workdir = None
+    url = args.url
+    if url is None:
+        workdir = tempfile.mkdtemp(prefix='cv-load-test-')
+        service, server, url = start_service(args.fast, workdir)
+
+    results = []
+    per_client = max(1, args.requests // args.concurrency)
+    threads = [threading.Thread(target=client, args=(url, per_client, args.revalidate, seed, results))
+               for seed in range(args.concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    latencies = sorted(seconds for _, seconds, _ in results)
+    statuses = {}
+    for status, _, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    transferred = sum(size for _, _, size in results)
+    print(f"\n⏱  {len(results)} requests from {args.concurrency} clients to {url} in {elapsed:.2f} s")
+    print(f"  {len(results) / elapsed:,.0f} requests/s, {transferred / elapsed / (1024 * 1024):.1f} MB/s")
+    print(f"  latency p50 {percentile(latencies, 0.5) * 1000:.1f} ms, p95 {percentile(latencies, 0.95) * 1000:.1f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+    print("  status " + ', '.join(f"{status}: {count}" for status, count in sorted(statuses.items())))
+    if service is not None:
+        print(f"  render cache: {service.hits} hits, {service.misses} misses")
+    if set(statuses) - {200, 304}:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,52 +3,849 @@ from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+import contextlib
+import copy
+import functools
+import hashlib
+import importlib.util
+import io
+import json
 import os
+import queue
 import re
 import shutil
-from typing import Dict, List
-try:
+import sys
+import threading
+import time
+import unicodedata
+import zipfile
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPT_DIR)
+
+# Component files the CV content is extracted from (relative to components/)
+COMPONENT_FILES = ['Hero.tsx', 'Experience.tsx', 'Skills.tsx', 'Projects.tsx']
+
+# Company logos copied from public/
+LOGO_FILES = {
+    'InfraCom': 'infracom-logo.png',
+    'Redpill Linpro': 'redpill-linpro-logo.png',
+    'T&M Hansson IT': 'hanssonit-logo.png',
+    'SenseNode': 'sensenode-logo.png',
+    'Vessinge IT': 'vessinge-logo.png',
+    'Orestad Linux': 'orestad-logo.png',
+    'HSN Konsult': 'hsn-konsult-logo.jpg'
+}
+
+# Per-language output file and section headers. Adding a language means adding
+# an entry here and its content in CVData.for_language().
+LANGUAGES = {
+    'sv': {
+        'label': "🇸🇪 Generating Swedish CV...",
+        'output': 'Daniel_Hansson_CV_2025_SV.docx',
+        'headers': {
+            'work_experience': "ARBETSLIVSERFARENHET",
+            'competencies': "NYCKELKOMPETENSER",
+            'education': "UTBILDNING",
+            'certificates': "Certifieringar:",
+            'skills': "IT-KOMPETENS",
+            'languages': "SPRÅK",
+            'projects': "PROJEKT & OPEN SOURCE"
+        }
+    },
+    'en': {
+        'label': "🇬🇧 Generating English CV...",
+        'output': 'Daniel_Hansson_CV_2025_ENG.docx',
+        'headers': {
+            'work_experience': "WORK EXPERIENCE",
+            'competencies': "KEY COMPETENCIES",
+            'education': "EDUCATION",
+            'certificates': "Certificates:",
+            'skills': "IT SKILLS",
+            'languages': "LANGUAGES",
+            'projects': "PROJECTS & OPEN SOURCE"
+        }
+    }
+}
+
+# Other company names and job titles that use one of the logos above
+LOGO_ALIASES = {
+    'Previous Sales Career': 'HSN Konsult',
+    'Tidigare entreprenörskarriär och försäljning': 'HSN Konsult'
+}
+
+# Legal-form suffixes ignored when matching company names
+COMPANY_SUFFIXES = {'ab', 'publ', 'as', 'inc', 'ltd', 'gmbh'}
+
+# Generator caches live next to the script, e.g. cv-generator/.cache/
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
+TRANSLATION_CACHE_PATH = os.path.join(CACHE_DIR, 'translations.json')
+TRANSLATION_CACHE_MAX_BYTES = 2 * 1024 * 1024
+ASSET_CACHE_DIR = os.path.join(CACHE_DIR, 'assets')
+SECTION_CACHE_PATH = os.path.join(CACHE_DIR, 'sections.json')
+SECTION_CACHE_MAX_BYTES = 4 * 1024 * 1024
+# Default trace written by --profile
+PROFILE_PATH = os.path.join(CACHE_DIR, 'profile.json')
+
+# Printed image sizes and the resolution images are downsampled to
+PROFILE_IMAGE_WIDTH = Inches(1.9)
+LOGO_HEIGHT = Inches(0.35)
+IMAGE_DPI = 300
+IMAGE_JPEG_QUALITY = 85
+
+# Compression of the saved .docx: XML parts are deflated at this level (0-9),
+# media that is compressed already is stored as is
+DOCX_DEFLATE_LEVEL = 6
+DOCX_STORED_CONTENT_TYPES = {'image/jpeg', 'image/png', 'image/gif'}
+
+# Reproducible documents are dated at SOURCE_DATE_EPOCH, or at the earliest
+# time a zip entry can have (1980-01-01) when it is not set
+REPRODUCIBLE_EPOCH = 315532800
+
+class _Stage:
+    """
+    One timed stage of a Profiler, used as a context manager.
+    """
+
+    def __init__(self, profiler: 'Profiler', name: str, is_section: bool = False):
+        self.profiler = profiler
+        self.name = name
+        self.is_section = is_section
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def open(self):
+        import tracemalloc
+        stack = self.profiler._stack()
+        self.path = f"{stack[-1].path}/{self.name}" if stack else self.name
+        stack.append(self)
+        self.memory = tracemalloc.get_traced_memory()[0]
+        self.cpu = time.thread_time()
+        self.wall = time.perf_counter()
+
+    def close(self):
+        import tracemalloc
+        stack = self.profiler._stack()
+        # Sections still open inside this stage end with it
+        while stack[-1] is not self:
+            stack[-1].close()
+        stack.pop()
+        wall = time.perf_counter()
+        self.profiler.records.append({
+            'path': self.path,
+            'thread': threading.get_ident(),
+            'start': self.wall - self.profiler.start_wall,
+            'wall': wall - self.wall,
+            'cpu': time.thread_time() - self.cpu,
+            'memory': tracemalloc.get_traced_memory()[0] - self.memory
+        })
+
+
+class Profiler:
+    """
+    Per-stage wall and CPU time, counters and peak memory for --profile.
+    Stages nest per thread (stage paths look like "render sv/Work Experience").
+    While disabled, stage(), section() and count() do nothing.
+    """
+    VERSION = 1
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self.counters = {}
+        self.start_wall = 0.0
+        self._start_cpu = 0.0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._cprofile = None
+
+    def start(self, cprofile: bool = False):
+        """
+        Start recording. Tracing memory allocations slows the run down, so
+        absolute timings are only comparable between profiled runs.
+        """
+        import tracemalloc
+        self.enabled = True
+        tracemalloc.start()
+        self.start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def _stack(self) -> List[_Stage]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def stage(self, name: str):
+        """
+        Context manager timing a stage.
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return _Stage(self, name)
+
+    def section(self, name: str):
+        """
+        End the current section of the innermost stage and start the next one,
+        for timing consecutive parts of a long function without nesting blocks.
+        """
+        if not self.enabled:
+            return
+        stack = self._stack()
+        if stack and stack[-1].is_section:
+            stack[-1].close()
+        _Stage(self, name, is_section=True).open()
+
+    def count(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Totals per stage path, in order of first start.
+        """
+        totals = {}
+        for record in sorted(self.records, key=lambda record: record['start']):
+            total = totals.setdefault(record['path'], {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'memory': 0})
+            total['calls'] += 1
+            total['wall'] += record['wall']
+            total['cpu'] += record['cpu']
+            total['memory'] += record['memory']
+        return totals
+
+    def finish(self, path: str = PROFILE_PATH, cprofile_path: Optional[str] = None):
+        """
+        Stop recording, write the JSON trace (and cProfile stats) and print a summary.
+        The trace is in Chrome trace event format, so it also opens in
+        chrome://tracing, Perfetto or speedscope.
+        """
+        import tracemalloc
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            if cprofile_path:
+                self._cprofile.dump_stats(cprofile_path)
+        wall = time.perf_counter() - self.start_wall
+        cpu = time.process_time() - self._start_cpu
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.enabled = False
+        
+        summary = self.summary()
+        pid = os.getpid()
+        trace = {
+            'version': self.VERSION,
+            'command': sys.argv,
+            'wall': wall,
+            'cpu': cpu,
+            'peak_memory': peak_memory,
+            'counters': self.counters,
+            'stages': summary,
+            'displayTimeUnit': 'ms',
+            'traceEvents': [
+                {
+                    'name': record['path'].rsplit('/', 1)[-1],
+                    'cat': 'stage',
+                    'ph': 'X',
+                    'pid': pid,
+                    'tid': record['thread'],
+                    'ts': record['start'] * 1e6,
+                    'dur': record['wall'] * 1e6,
+                    'args': {'path': record['path'], 'cpu_ms': record['cpu'] * 1000, 'memory': record['memory']}
+                }
+                for record in self.records
+            ]
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=1)
+        os.replace(path + '.tmp', path)
+        
+        print("\n⏱  Profile:")
+        for stage_path, total in summary.items():
+            indent = '  ' * stage_path.count('/')
+            calls = f" ×{total['calls']}" if total['calls'] > 1 else ''
+            print(f"  {indent}{stage_path.rsplit('/', 1)[-1]}{calls}: "
+                  f"{total['wall'] * 1000:.1f} ms wall, {total['cpu'] * 1000:.1f} ms CPU")
+        for name, value in sorted(self.counters.items()):
+            print(f"  {name}: {value:,}")
+        print(f"  Total: {wall * 1000:.1f} ms wall, {cpu * 1000:.1f} ms CPU, "
+              f"peak memory {peak_memory / (1024 * 1024):.1f} MB")
+        print(f"  ✓ Trace saved to {path}")
+        if self._cprofile is not None and cprofile_path:
+            print(f"  ✓ cProfile stats saved to {cprofile_path}")
+
+profiler = Profiler()
+
+
+class DiskCache:
+    """
+    Persistent on-disk cache of text entries, stored as JSON with the time each
+    entry was last used. When the cache grows past max_bytes, the least recently
+    used entries are evicted on save. Subclasses define the keys and bump
+    VERSION whenever the meaning of their entries changes.
+    """
+    VERSION = 1
+    NAME = 'cache'
+
+    def __init__(self, path: str, max_bytes: int, enabled: bool = True):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._dirty = False
+        # The --serve threads render (and save) concurrently
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict:
+        if self._entries is None:
+            self._entries = {}
+            if self.enabled and os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        payload = json.load(f)
+                    if payload.get('version') == self.VERSION:
+                        self._entries = payload.get('entries', {})
+                except (OSError, ValueError) as e:
+                    print(f"  ⚠ Ignoring unreadable {self.NAME}: {e}")
+        return self._entries
+
+    def _get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry['used'] = time.time()
+            self._dirty = True
+            return entry['text']
+
+    def _put(self, key: str, text: str):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._load()[key] = {
+                'text': text,
+                'used': time.time()
+            }
+            self._dirty = True
+
+    def _evict(self):
+        entries = self._load()
+        sizes = {key: len(key) + len(json.dumps(entry, ensure_ascii=False)) for key, entry in entries.items()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used entries until we fit the budget again
+        for key in sorted(entries, key=lambda k: entries[k].get('used', 0)):
+            if total <= self.max_bytes:
+                break
+            total -= sizes[key]
+            del entries[key]
+
+    def save(self):
+        if not self.enabled or not self._dirty:
+            return
+        with self._lock:
+            self._evict()
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # Render worker processes may save at the same time, the last one wins
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'entries': self._entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+class TranslationCache(DiskCache):
+    """
+    Persistent on-disk cache of translated strings.
+    Entries are content-addressed on (source_lang, target_lang, sha256 of the text),
+    so unchanged source strings never reach the translator again.
+    """
+    NAME = 'translation cache'
+
+    def __init__(self, path: str = TRANSLATION_CACHE_PATH,
+                 max_bytes: int = TRANSLATION_CACHE_MAX_BYTES, enabled: bool = True):
+        super().__init__(path, max_bytes, enabled)
+
+    @staticmethod
+    def make_key(text: str, source_lang: str, target_lang: str) -> str:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return f"{source_lang}:{target_lang}:{digest}"
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        return self._get(self.make_key(text, source_lang, target_lang))
+
+    def put(self, text: str, source_lang: str, target_lang: str, translated: str):
+        self._put(self.make_key(text, source_lang, target_lang), translated)
+
+translation_cache = TranslationCache()
+
+TRANSLATION_WORKERS = 8
+
+# Number of strings that fell back to their source text during this run
+translation_failures = 0
+TRANSLATION_CHUNK_CHARS = 4500
+
+# Seconds all translator calls of a run may take together, and each call on its own
+TRANSLATION_DEADLINE = 60.0
+TRANSLATION_CALL_TIMEOUT = 10.0
+# Consecutive failed calls after which the translator is not called again this run
+TRANSLATION_BREAKER_THRESHOLD = 3
+
+class CircuitBreaker:
+    """
+    Guards the translator during a run. The breaker trips after `threshold`
+    consecutive failed calls or once `deadline` seconds have passed since the
+    first call; from then on the remaining strings short-circuit to their
+    cached or source text instead of each waiting out its own timeout.
+    reset() closes it again for the next run.
+    """
+
+    def __init__(self, threshold: int = TRANSLATION_BREAKER_THRESHOLD,
+                 deadline: Optional[float] = TRANSLATION_DEADLINE,
+                 call_timeout: Optional[float] = TRANSLATION_CALL_TIMEOUT):
+        self.threshold = threshold
+        self.deadline = deadline
+        self.call_timeout = call_timeout
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.failures = 0
+        self.reason = None
+        self.started = None
+
+    def arm(self):
+        """
+        Start the deadline on the first call of the run.
+        """
+        if self.started is None:
+            self.started = time.monotonic()
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline is None or self.started is None:
+            return None
+        return max(0.0, self.started + self.deadline - time.monotonic())
+
+    def timeout(self) -> Optional[float]:
+        """
+        Return how long the next call may take: its own timeout, capped by the deadline.
+        """
+        remaining = self.remaining()
+        if remaining is None or self.call_timeout is None:
+            return self.call_timeout if remaining is None else remaining
+        return min(self.call_timeout, remaining)
+
+    @property
+    def is_open(self) -> bool:
+        if self.reason is None and self.remaining() == 0:
+            self.trip(f"deadline of {self.deadline:g} s passed")
+        return self.reason is not None
+
+    def trip(self, reason: str):
+        with self._lock:
+            if self.reason is None:
+                self.reason = reason
+
+    def record(self, success: bool):
+        with self._lock:
+            self.failures = 0 if success else self.failures + 1
+            failures = self.failures
+        if failures >= self.threshold:
+            self.trip(f"{failures} consecutive failures")
+
+translation_breaker = CircuitBreaker()
+
+class TranslatorPool:
+    """
+    Idle translator clients per backend and language pair, shared by every
+    batch of a run. deep_translator clients keep per-request state on the
+    instance, so a client is checked out by one worker thread at a time and
+    put back when its batch is done; at most max_idle are kept per pair.
+    """
+
+    def __init__(self, max_idle: int = TRANSLATION_WORKERS):
+        self.max_idle = max_idle
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, source_lang: str, target_lang: str, translator_factory=None):
+        factory = translator_factory or _default_translator_factory
+        with self._lock:
+            idle = self._idle.get((factory, source_lang, target_lang))
+            if idle:
+                return idle.pop()
+        profiler.count('translator clients')
+        return factory(source_lang, target_lang)
+
+    def release(self, translator, source_lang: str, target_lang: str, translator_factory=None):
+        factory = translator_factory or _default_translator_factory
+        with self._lock:
+            idle = self._idle.setdefault((factory, source_lang, target_lang), [])
+            if len(idle) < self.max_idle:
+                idle.append(translator)
+
+translator_pool = TranslatorPool()
+
+class TranslationUnavailable(Exception):
+    """
+    Raised by a translation backend that cannot translate a string.
+    """
+
+# Phrase table of the skill category titles and other short terms that recur in
+# the CV, per (source, target) language pair. Extend it with --glossary FILE.
+TRANSLATION_GLOSSARY = {
+    ('sv', 'en'): {
+        'Virtualisering & Hypervisors': 'Virtualization & Hypervisors',
+        'Operativsystem & Servrar': 'Operating Systems & Servers',
+        'OS & Servrar': 'OS & Servers',
+        'Backup & Lagring': 'Backup & Storage',
+        'Nätverk & Säkerhet': 'Network & Security',
+        'Drift & Management': 'Operations & Management',
+        'Automation & Skriptning': 'Automation & Scripting',
+        'Automation': 'Automation'
+    }
+}
+
+# Punctuation and whitespace around a glossary term, kept from the source text
+_GLOSSARY_TERM_RE = re.compile(r'^([\W_]*)(.*?)([\W_]*)$', re.DOTALL)
+
+def normalize_term(text: str) -> str:
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+def load_glossary(path: str, source_lang: str = 'sv', target_lang: str = 'en'):
+    """
+    Add the {source term: translation} entries of a JSON file to the glossary.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    TRANSLATION_GLOSSARY.setdefault((source_lang, target_lang), {}).update(entries)
+
+class GlossaryTranslator:
+    """
+    Translation backend answering from a phrase table without touching the network.
+    Exact matches are tried first, then matches ignoring case, whitespace and
+    surrounding punctuation, which are kept from the source text. Misses go to
+    the fallback backend, created on first use, or raise TranslationUnavailable
+    right away when there is none.
+
+    A backend is any object with translate(text); translate_batch also asks
+    lookup(text) of backends that have it before the translation cache, so
+    glossary answers are never cached and edits to the glossary apply at once.
+    """
+
+    def __init__(self, entries: Dict[str, str], fallback_factory=None):
+        self.entries = entries
+        self.normalized = {normalize_term(term): translation for term, translation in entries.items()}
+        self.fallback_factory = fallback_factory
+        self._fallback = None
+
+    def lookup(self, text: str) -> Optional[str]:
+        if text in self.entries:
+            return self.entries[text]
+        prefix, term, suffix = _GLOSSARY_TERM_RE.match(text).groups()
+        translation = self.normalized.get(normalize_term(term)) if term else None
+        if translation is None:
+            return None
+        if term.isupper() and len(term) > 1:
+            translation = translation.upper()
+        elif term[:1].isupper():
+            translation = translation[:1].upper() + translation[1:]
+        return prefix + translation + suffix
+
+    def translate(self, text: str) -> str:
+        translation = self.lookup(text)
+        if translation is not None:
+            return translation
+        if self.fallback_factory is None:
+            raise TranslationUnavailable(f"no glossary entry for {text[:40]!r}")
+        if self._fallback is None:
+            self._fallback = self.fallback_factory()
+        return self._fallback.translate(text)
+
+def network_translator_factory(source_lang: str, target_lang: str):
+    # Imported on first use so that importing this module stays cheap
     from deep_translator import GoogleTranslator
-    HAS_TRANSLATOR = True
-except ImportError:
-    HAS_TRANSLATOR = False
-    print("⚠ deep_translator not installed. Install with: pip install deep-translator")
-    print("  Will use fallback translations.")
+    return GoogleTranslator(source=source_lang, target=target_lang)
+
+def _default_translator_factory(source_lang: str, target_lang: str):
+    return GlossaryTranslator(TRANSLATION_GLOSSARY.get((source_lang, target_lang), {}),
+                              lambda: network_translator_factory(source_lang, target_lang))
+
+def offline_translator_factory(source_lang: str, target_lang: str):
+    """
+    Translate from the glossary only; strings it does not know fail at once.
+    """
+    return GlossaryTranslator(TRANSLATION_GLOSSARY.get((source_lang, target_lang), {}))
+
+_has_translator = None
+
+def has_translator() -> bool:
+    """
+    Check once whether deep_translator is installed, warning if it is not.
+    """
+    global _has_translator
+    if _has_translator is None:
+        _has_translator = importlib.util.find_spec('deep_translator') is not None
+        if not _has_translator:
+            print("⚠ deep_translator not installed. Install with: pip install deep-translator")
+            print("  Will use fallback translations.")
+    return _has_translator
+
+def _translate_one(translator, text: str) -> str:
+    with profiler.stage('translate_text'):
+        profiler.count('translation calls')
+        # Split long texts into chunks (Google Translate has a 5000 char limit)
+        if len(text) <= TRANSLATION_CHUNK_CHARS:
+            return translator.translate(text)
+
+        # Split by sentences
+        sentences = re.split(r'([.!?]\s+)', text)
+        translated_parts = []
+        current_chunk = ""
+    
+        for part in sentences:
+            if len(current_chunk + part) < TRANSLATION_CHUNK_CHARS:
+                current_chunk += part
+            else:
+                if current_chunk:
+                    translated_parts.append(translator.translate(current_chunk))
+                current_chunk = part
+    
+        if current_chunk:
+            translated_parts.append(translator.translate(current_chunk))
+    
+        return ''.join(translated_parts)
+
+def _call_with_timeout(func, timeout: Optional[float], *args):
+    """
+    Call func(*args) on a daemon thread and wait at most `timeout` seconds for
+    it. A call that does not return in time is abandoned: it cannot hold up the
+    run, or its exit, however long the connection hangs.
+    """
+    outcome = {}
+    def call():
+        try:
+            outcome['result'] = func(*args)
+        except Exception as e:
+            outcome['error'] = e
+    thread = threading.Thread(target=call, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"no answer within {timeout:g} s")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+def translate_sentences(sentences: List[str], source_lang: str, target_lang: str, translator_factory=None,
+                        max_workers: int = TRANSLATION_WORKERS, breaker: CircuitBreaker = None) -> Dict:
+    """
+    Send sentences to the translator on a bounded pool of worker threads and
+    return {sentence: translation or the exception it failed with}. Sentences
+    left out of the result were never sent because the breaker tripped or the
+    deadline passed first.
+    """
+    breaker = breaker or translation_breaker
+    breaker.arm()
+    todo = list(reversed(sentences))
+    todo_lock = threading.Lock()
+    done = queue.Queue()
+
+    def worker():
+        translator = translator_pool.acquire(source_lang, target_lang, translator_factory)
+        while True:
+            with todo_lock:
+                if not todo or breaker.is_open:
+                    translator_pool.release(translator, source_lang, target_lang, translator_factory)
+                    return
+                sentence = todo.pop()
+            try:
+                translated = _call_with_timeout(_translate_one, breaker.timeout(), translator, sentence)
+            except TranslationUnavailable as e:
+                # The backend answered, there is just nothing to translate with
+                done.put((sentence, e))
+                continue
+            except Exception as e:
+                breaker.record(False)
+                if isinstance(e, TimeoutError):
+                    # The abandoned call may still be using this client, it is not put back
+                    translator = translator_pool.acquire(source_lang, target_lang, translator_factory)
+                done.put((sentence, e))
+                continue
+            breaker.record(True)
+            done.put((sentence, translated))
+
+    # Daemon threads, so that a hung call cannot keep the process alive
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, min(max_workers, len(sentences))))]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join(breaker.remaining())
+        if thread.is_alive():
+            # Only possible once the deadline passed; calls still running are abandoned
+            breaker.trip(f"deadline of {breaker.deadline:g} s passed")
+            break
+
+    results = {}
+    while not done.empty():
+        sentence, outcome = done.get()
+        results[sentence] = outcome
+    return results
+
+# Sentence boundaries: terminal punctuation, optionally closed by a quote or
+# bracket, followed by whitespace, or a line break on its own
+_SENTENCE_BOUNDARY_RE = re.compile(r'[.!?…]+["”’)\]]*(\s+)|(\s*\n\s*)')
+
+# Abbreviations whose trailing period does not end a sentence
+SENTENCE_ABBREVIATIONS = {
+    't.ex', 'bl.a', 'm.m', 'm.fl', 'd.v.s', 'dvs', 'osv', 'o.s.v', 'ca', 'inkl', 'exkl',
+    'resp', 'jfr', 'nr', 'st', 'e.g', 'i.e', 'etc', 'vs', 'approx'
+}
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences and the whitespace between them, alternating
+    [sentence, separator, sentence, ..., sentence], so that joining the parts
+    gives back the text. Line breaks always separate sentences; terminal
+    punctuation only does when the next sentence starts with a capital letter
+    or digit and the period does not end a known abbreviation.
+    """
+    parts = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+        group = 1 if match.group(1) is not None else 2
+        sep_start, sep_end = match.span(group)
+        if sep_end == len(text):
+            break
+        if group == 1 and '\n' not in match.group(1):
+            following = text[sep_end]
+            words = text[start:sep_start].split()
+            last_word = words[-1].rstrip('.').lower() if words else ''
+            if not (following.isupper() or following.isdigit()) or last_word in SENTENCE_ABBREVIATIONS:
+                continue
+        parts.append(text[start:sep_start])
+        parts.append(text[sep_start:sep_end])
+        start = sep_end
+    parts.append(text[start:])
+    return parts
+
+def translate_batch(texts: List[str], source_lang: str = 'sv', target_lang: str = 'en',
+                    translator_factory=None, max_workers: int = TRANSLATION_WORKERS) -> Dict[str, str]:
+    """
+    Translate many strings in one go and return a {source text: translation} mapping.
+    The cache works as a sentence-level translation memory: every string is split
+    into sentences, each sentence is looked up on its own and only sentences that
+    were never translated are sent, concurrently on a bounded thread pool. The
+    translations are then joined back with the original whitespace, so editing one
+    sentence of a description costs one translation instead of the whole text.
+    Falls back to the original sentence for every sentence whose translation fails
+    or that is skipped because the translation_breaker tripped, and counts the
+    strings affected in translation_failures.
+    Pass translator_factory(source_lang, target_lang) to use another backend.
+    """
+    global translation_failures
+    results = {}
+    segmented = {}
+    segments = {}
+    pending = {}
+    # Glossary lookups only read the client, so it can go back to the pool right away
+    translator = translator_pool.acquire(source_lang, target_lang, translator_factory)
+    lookup = getattr(translator, 'lookup', None)
+    translator_pool.release(translator, source_lang, target_lang, translator_factory)
+    for text in texts:
+        if text in results or text in segmented:
+            continue
+        if not text or not text.strip():
+            results[text] = text
+            continue
+        parts = segmented[text] = split_sentences(text)
+        for sentence in parts[::2]:
+            if sentence in segments or sentence in pending:
+                continue
+            if not sentence.strip():
+                segments[sentence] = sentence
+                continue
+            known = lookup(sentence) if lookup else None
+            if known is not None:
+                profiler.count('glossary hits')
+                segments[sentence] = known
+                continue
+            cached = translation_cache.get(sentence, source_lang, target_lang)
+            if cached is not None:
+                profiler.count('translation cache hits')
+                segments[sentence] = cached
+            else:
+                profiler.count('translation cache misses')
+                pending[sentence] = None
+
+    translated = {}
+    if pending and (translator_factory is not None or has_translator()) and not translation_breaker.is_open:
+        translated = translate_sentences(list(pending), source_lang, target_lang, translator_factory, max_workers)
+        if translation_breaker.is_open:
+            print(f"  ⚠ Translator circuit breaker tripped ({translation_breaker.reason}), "
+                  "skipping the remaining strings")
+
+    failed = set()
+    unavailable = 0
+    for sentence in pending:
+        outcome = translated.get(sentence)
+        if isinstance(outcome, str):
+            # Only successful translations are cached, failures are retried next run
+            translation_cache.put(sentence, source_lang, target_lang, outcome)
+            segments[sentence] = outcome
+            continue
+        if isinstance(outcome, TranslationUnavailable):
+            unavailable += 1
+        elif outcome is not None:
+            print(f"  ⚠ Translation failed: {outcome}")
+        failed.add(sentence)
+        segments[sentence] = sentence
+    if unavailable:
+        print(f"  ⚠ {unavailable} sentences have no offline translation, kept untranslated")
+
+    for text, parts in segmented.items():
+        results[text] = ''.join(segments[part] if i % 2 == 0 else part for i, part in enumerate(parts))
+        if failed.intersection(parts[::2]):
+            translation_failures += 1
+    return results
 
 def translate_text(text: str, source_lang: str = 'sv', target_lang: str = 'en') -> str:
     """
     Translate text using Google Translate via deep_translator.
+    Cached translations are returned without touching the translator.
     Falls back to original text if translation fails.
     """
-    if not HAS_TRANSLATOR:
-        return text
-    
-    try:
-        translator = GoogleTranslator(source=source_lang, target=target_lang)
-        # Split long texts into chunks (Google Translate has a 5000 char limit)
-        if len(text) > 4500:
-            # Split by sentences
-            sentences = re.split(r'([.!?]\s+)', text)
-            translated_parts = []
-            current_chunk = ""
-            
-            for i, part in enumerate(sentences):
-                if len(current_chunk + part) < 4500:
-                    current_chunk += part
-                else:
-                    if current_chunk:
-                        translated_parts.append(translator.translate(current_chunk))
-                    current_chunk = part
-            
-            if current_chunk:
-                translated_parts.append(translator.translate(current_chunk))
-            
-            return ''.join(translated_parts)
-        else:
-            return translator.translate(text)
-    except Exception as e:
-        print(f"  ⚠ Translation failed: {e}")
-        return text
+    return translate_batch([text], source_lang, target_lang)[text]
+
+def add_picture(run, image_data: bytes, name: str, **size):
+    """
+    Add an in-memory picture to a run, named after its source file
+    the way run.add_picture(path) names it.
+    """
+    inline_shape = run.add_picture(io.BytesIO(image_data), **size)
+    inline_shape._inline.graphic.graphicData.pic.nvPicPr.cNvPr.name = name
+    return inline_shape
+
+HYPERLINK_RELTYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink'
 
 def add_hyperlink(paragraph, url, text):
     """
@@ -56,7 +853,7 @@ def add_hyperlink(paragraph, url, text):
     """
     # This gets access to the document.xml.rels file and gets a new relation id value
     part = paragraph.part
-    r_id = part.relate_to(url, 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink', is_external=True)
+    r_id = part.relate_to(url, HYPERLINK_RELTYPE, is_external=True)
 
     # Create the w:hyperlink tag and add needed values
     hyperlink = OxmlElement('w:hyperlink')
@@ -81,210 +878,408 @@ def add_hyperlink(paragraph, url, text):
 
     return hyperlink
 
+# Tokens of the TypeScript object-literal subset used in our components.
+# Whitespace and comments are consumed as a prefix of the next token and every
+# match consumes at least one character, so scanning is linear.
+_TS_TOKEN_RE = re.compile(r"""
+    (?:\s+|//[^\n]*|/\*.*?\*/)*
+    (?:
+      (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<template>`(?:[^`\\]|\\.)*`)
+    | (?P<punct>[{}\[\]:,])
+    | (?P<word>[^\s{}\[\]:,'"`/]+)
+    | (?P<error>.)
+    | $
+    )
+""", re.VERBOSE | re.DOTALL)
+
+_TS_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+_TS_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+                      '\n': '', '\r\n': ''}
+
+def _ts_unescape_match(match) -> str:
+    seq = match.group(1)
+    if seq in _TS_SIMPLE_ESCAPES:
+        return _TS_SIMPLE_ESCAPES[seq]
+    if seq.startswith('u{'):
+        return chr(int(seq[2:-1], 16))
+    if len(seq) > 1 and seq[0] in 'ux':
+        return chr(int(seq[1:], 16))
+    return seq
+
+def tokenize_ts(source: str, pos: int = 0, end: Optional[int] = None):
+    """
+    Yield (kind, start, end) tokens for the TypeScript object-literal subset.
+    Tokens are index slices into source, nothing is copied. Whitespace and
+    comments are skipped. kind is 'punct', 'string', 'template' or 'word'.
+    """
+    if end is None:
+        end = len(source)
+    for match in _TS_TOKEN_RE.finditer(source, pos, end):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        start = match.start(kind)
+        if kind == 'error':
+            line = source.count('\n', 0, start) + 1
+            raise ValueError(f"Unexpected or unterminated token at line {line}: {source[start:start + 20]!r}")
+        yield kind, start, match.end()
+
+class _TsLiteralParser:
+    """
+    Recursive-descent parser turning tokens into Python values:
+    objects become dicts, arrays lists, strings and template literals str,
+    true/false bool, null/undefined None and numbers int/float.
+    """
+
+    def __init__(self, source: str, pos: int = 0, end: Optional[int] = None):
+        self.source = source
+        self.tokens = tokenize_ts(source, pos, end)
+
+    def _next(self):
+        token = next(self.tokens, None)
+        if token is None:
+            raise ValueError("Unexpected end of TypeScript literal")
+        return token
+
+    def _error(self, message: str, pos: int):
+        line = self.source.count('\n', 0, pos) + 1
+        raise ValueError(f"{message} at line {line}")
+
+    def _string(self, start: int, end: int) -> str:
+        value = self.source[start + 1:end - 1]
+        if '\\' in value:
+            value = _TS_ESCAPE_RE.sub(_ts_unescape_match, value)
+        return value
+
+    def parse_value(self, token=None):
+        kind, start, end = token or self._next()
+        if kind == 'string' or kind == 'template':
+            return self._string(start, end)
+        if kind == 'punct':
+            char = self.source[start]
+            if char == '{':
+                return self._parse_object()
+            if char == '[':
+                return self._parse_array()
+            self._error(f"Unexpected {char!r}", start)
+        word = self.source[start:end]
+        if word == 'true' or word == 'false':
+            return word == 'true'
+        if word == 'null' or word == 'undefined':
+            return None
+        try:
+            return int(word)
+        except ValueError:
+            try:
+                return float(word)
+            except ValueError:
+                # Identifier references are kept as their source text
+                return word
+
+    def _parse_array(self) -> List:
+        items = []
+        while True:
+            token = self._next()
+            if token[0] == 'punct' and self.source[token[1]] == ']':
+                return items
+            items.append(self.parse_value(token))
+            kind, start, _ = self._next()
+            char = self.source[start] if kind == 'punct' else ''
+            if char == ']':
+                return items
+            if char != ',':
+                self._error("Expected ',' or ']' in array", start)
+
+    def _parse_object(self) -> Dict:
+        result = {}
+        while True:
+            kind, start, end = self._next()
+            if kind == 'punct':
+                if self.source[start] == '}':
+                    return result
+                self._error("Expected property name", start)
+            key = self._string(start, end) if kind == 'string' else self.source[start:end]
+            kind, start, _ = self._next()
+            if kind != 'punct' or self.source[start] != ':':
+                self._error(f"Expected ':' after {key!r}", start)
+            result[key] = self.parse_value()
+            kind, start, _ = self._next()
+            char = self.source[start] if kind == 'punct' else ''
+            if char == '}':
+                return result
+            if char != ',':
+                self._error("Expected ',' or '}' in object", start)
+
 def extract_tsx_data(content: str, var_name: str) -> List[Dict]:
     """
     Extract data from TSX file by finding the array assigned to a variable.
-    This is a simple parser that handles the structure in our component files.
+    The array literal is parsed in a single pass straight from the file content.
     """
-    # Find the variable declaration
-    pattern = rf'const {var_name}:\s*\w+\[\]\s*=\s*\[(.*?)\];'
-    match = re.search(pattern, content, re.DOTALL)
+    # Find the variable declaration, e.g. "const experiences: ExperienceItemProps[] = ["
+    match = re.search(rf'const {var_name}\s*(?::[^=;]*)?=\s*\[', content)
     
     if not match:
         return []
     
-    array_content = match.group(1)
-    items = []
-    
-    # Split by objects (find { ... }, pairs)
-    brace_count = 0
-    current_obj = ""
-    in_string = False
-    escape_next = False
-    
-    for char in array_content:
-        if escape_next:
-            current_obj += char
-            escape_next = False
-            continue
-            
-        if char == '\\':
-            escape_next = True
-            current_obj += char
-            continue
-            
-        if char in ['"', "'", '`'] and not escape_next:
-            in_string = not in_string
-            
-        if not in_string:
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                
-        current_obj += char
-        
-        if brace_count == 0 and current_obj.strip().endswith('}'):
-            # Parse this object
-            obj_str = current_obj.strip().rstrip(',').strip()
-            if obj_str:
-                items.append(parse_tsx_object(obj_str))
-            current_obj = ""
-    
-    return items
+    parser = _TsLiteralParser(content, match.end() - 1)
+    return parser.parse_value()
 
 def parse_tsx_object(obj_str: str) -> Dict:
     """
     Parse a simple TypeScript object into a Python dict.
-    Handles strings, arrays, and nested structures.
-    """
-    result = {}
-    
-    # Remove outer braces
-    obj_str = obj_str.strip()
-    if obj_str.startswith('{') and obj_str.endswith('}'):
-        obj_str = obj_str[1:-1]
-    
-    # Simple regex patterns for key-value pairs
-    # Match: key: 'value' or key: "value" or key: `value`
-    string_pattern = r"(\w+):\s*['\"`](.*?)['\"`](?=\s*,|\s*}|\s*$)"
-    # Match: key: [...] for arrays
-    array_pattern = r"(\w+):\s*\[(.*?)\](?=\s*,|\s*}|\s*$)"
-    # Match: key: true/false
-    bool_pattern = r"(\w+):\s*(true|false)(?=\s*,|\s*}|\s*$)"
-    
-    # Extract string values
-    for match in re.finditer(string_pattern, obj_str, re.DOTALL):
-        key = match.group(1)
-        value = match.group(2).replace('\\n', '\n').replace("\\'", "'").replace('\\"', '"')
-        result[key] = value
-    
-    # Extract array values
-    for match in re.finditer(array_pattern, obj_str, re.DOTALL):
-        key = match.group(1)
-        array_content = match.group(2)
-        # Split by comma (simple approach)
-        items = []
-        for item in re.findall(r"['\"`](.*?)['\"`]", array_content):
-            items.append(item)
-        result[key] = items
-    
-    # Extract boolean values
-    for match in re.finditer(bool_pattern, obj_str):
-        key = match.group(1)
-        value = match.group(2) == 'true'
-        result[key] = value
-    
+    Handles strings, template literals, arrays, booleans, nested objects and comments.
+    """
+    parser = _TsLiteralParser(obj_str)
+    return parser.parse_value()
+
+# ioctl request number for FICLONE on Linux (copy-on-write clone of a whole file)
+FICLONE = 0x40049409
+
+def _reflink(src_path: str, dst_path: str):
+    """
+    Clone src_path to dst_path sharing the same data blocks (btrfs, XFS, ...).
+    Raises OSError where the platform or filesystem does not support it.
+    """
+    if not sys.platform.startswith('linux'):
+        raise OSError("reflink is only supported on Linux")
+    import fcntl
+    with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    shutil.copystat(src_path, dst_path)
+
+def sync_file(src_path: str, dst_path: str) -> str:
+    """
+    Make dst_path a copy of src_path, writing only when the content differs.
+    Files with the same size and mtime, or the same size and content hash, are
+    left alone. Changed files are reflinked, hardlinked or copied, in that order
+    of preference, and replaced atomically.
+    Returns 'unchanged', 'reflinked', 'hardlinked' or 'copied'.
+    """
+    src_stat = os.stat(src_path)
+    try:
+        dst_stat = os.stat(dst_path)
+    except FileNotFoundError:
+        dst_stat = None
+    
+    if dst_stat is not None and dst_stat.st_size == src_stat.st_size:
+        if os.path.samestat(src_stat, dst_stat) or dst_stat.st_mtime_ns == src_stat.st_mtime_ns:
+            return 'unchanged'
+        if file_digest(src_path) == file_digest(dst_path):
+            return 'unchanged'
+    
+    tmp_path = dst_path + '.tmp'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        _reflink(src_path, tmp_path)
+        result = 'reflinked'
+    except OSError:
+        if os.path.lexists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            os.link(src_path, tmp_path)
+            result = 'hardlinked'
+        except OSError:
+            shutil.copy2(src_path, tmp_path)
+            result = 'copied'
+    os.replace(tmp_path, dst_path)
     return result
 
-def extract_content_from_repo() -> Dict:
+def sync_logos(repo_root: str = REPO_ROOT) -> Dict[str, str]:
+    """
+    Mirror the company logos from public/ to the CV logo directory and return
+    {company: logo path in public/} for the logos that exist.
+    """
+    print("\n📥 Syncing company logos...")
+    logos = {}
+    public_dir = os.path.join(repo_root, 'public')
+    # Use /tmp for dev containers, or the default path if it exists
+    default_logos_dir = '/home/daniel/Music/CV/logos'
+    if os.path.exists('/home/daniel'):
+        logos_dir = default_logos_dir
+    else:
+        # In dev container or other environment, use a temp directory
+        logos_dir = os.path.join(repo_root, 'cv-generator', 'logos')
+    os.makedirs(logos_dir, exist_ok=True)
+    
+    unchanged = 0
+    for company_key, logo_file in LOGO_FILES.items():
+        src_path = os.path.join(public_dir, logo_file)
+        dst_path = os.path.join(logos_dir, logo_file)
+        if os.path.exists(src_path):
+            result = sync_file(src_path, dst_path)
+            # The CV is rendered straight from public/, the copy is only a mirror
+            logos[company_key] = src_path
+            if result == 'unchanged':
+                unchanged += 1
+            else:
+                print(f"  ✓ {company_key} ({result})")
+        else:
+            print(f"  ⚠ Logo not found: {logo_file}")
+    if unchanged:
+        print(f"  ✓ {unchanged} logos already up to date")
+    return logos
+
+def parse_hero(content: str) -> Dict:
+    """
+    Extract the profile title and Swedish profile text from Hero.tsx.
+    """
+    fields = {}
+    # Extract the title (subtitle line)
+    title_match = re.search(r'<p className="text-xl.*?>\s*(.+?)\s*</p>', content, re.DOTALL)
+    if title_match:
+        fields['profile_title_sv'] = re.sub(r'\s+', ' ', title_match.group(1)).strip()
+        print(f"  ✓ Found profile title")
+    
+    # Extract the Swedish profile text - look for the max-w-2xl paragraph
+    desc_match = re.search(r'<p className="max-w-2xl[^>]*>\s*(.+?)\s*</p>', content, re.DOTALL)
+    if desc_match:
+        # Extract the text and clean up whitespace
+        raw_text = desc_match.group(1)
+        # Remove extra whitespace and newlines but keep sentence structure
+        fields['profile_text_sv'] = re.sub(r'\s+', ' ', raw_text).strip()
+        print(f"  ✓ Found profile text (Swedish)")
+        if not fields['profile_text_sv']:
+            print(f"  ⚠ Profile text was empty after extraction")
+    return fields
+
+def parse_experience(content: str) -> Dict:
+    experiences = extract_tsx_data(content, 'experiences')
+    print(f"  ✓ Extracted {len(experiences)} work experiences")
+    return {'experiences': experiences}
+
+def parse_skills(content: str) -> Dict:
+    skills = extract_tsx_data(content, 'skillCategories')
+    print(f"  ✓ Extracted {len(skills)} skill categories")
+    return {'skills': skills}
+
+def parse_projects(content: str) -> Dict:
+    projects = extract_tsx_data(content, 'projects')
+    print(f"  ✓ Extracted {len(projects)} projects")
+    return {'projects': projects}
+
+# Parser of every component file, returning the fields of the CV data it provides
+COMPONENT_PARSERS = {
+    'Hero.tsx': parse_hero,
+    'Experience.tsx': parse_experience,
+    'Skills.tsx': parse_skills,
+    'Projects.tsx': parse_projects
+}
+
+# Intermediate file with the fields extracted from every component file.
+# Bump the version whenever a parser changes what it extracts.
+CV_DATA_PATH = os.path.join(CACHE_DIR, 'cv-data.json')
+CV_DATA_VERSION = 1
+
+def _load_cv_data(path: str, repo_root: str) -> Dict[str, Dict]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  ⚠ Ignoring unreadable {os.path.basename(path)}: {e}")
+        return {}
+    if payload.get('version') != CV_DATA_VERSION or payload.get('repo_root') != repo_root:
+        return {}
+    return payload.get('files', {})
+
+def _save_cv_data(path: str, repo_root: str, files: Dict[str, Dict]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CV_DATA_VERSION, 'repo_root': repo_root, 'files': files}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+def extract_components(repo_root: str = REPO_ROOT, components: List[str] = COMPONENT_FILES,
+                       cache_path: Optional[str] = CV_DATA_PATH) -> Dict[str, Dict]:
+    """
+    Return {component file: extracted fields} for the component files that exist.
+    Every file is recorded in the cv-data.json intermediate with its size,
+    modification time and sha256. A file whose size and modification time, or
+    failing that whose hash, still match is taken from it without being parsed;
+    the others are read concurrently, parsed once each and written back.
+    Pass cache_path=None to always read and parse every file.
+    """
+    cached = _load_cv_data(cache_path, repo_root)
+    fields = {}
+    to_read = {}
+    parsed = set()
+    for name in components:
+        path = os.path.join(repo_root, 'components', name)
+        if not os.path.exists(path):
+            continue
+        stat = os.stat(path)
+        entry = cached.get(name)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            fields[name] = entry['fields']
+        else:
+            to_read[name] = path
+
+    if to_read:
+        # Imported on first use so that importing this module stays cheap
+        from concurrent.futures import ThreadPoolExecutor
+        with profiler.stage('read components'), ThreadPoolExecutor(max_workers=len(to_read)) as pool:
+            contents = dict(zip(to_read, pool.map(_read_bytes, to_read.values())))
+        for name, raw in contents.items():
+            profiler.count('bytes read', len(raw))
+            digest = hashlib.sha256(raw).hexdigest()
+            entry = cached.get(name)
+            if entry is None or entry['sha256'] != digest:
+                # Decoded the way text mode reads it, with universal newlines
+                content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+                with profiler.stage(f'parse {name}'):
+                    entry = {'sha256': digest, 'fields': COMPONENT_PARSERS[name](content)}
+                parsed.add(name)
+            stat = os.stat(to_read[name])
+            entry['size'], entry['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+            cached[name] = entry
+            fields[name] = entry['fields']
+        if cache_path:
+            _save_cv_data(cache_path, repo_root, cached)
+
+    reused = [name for name in components if name in fields and name not in parsed]
+    if reused:
+        profiler.count('components from cache', len(reused))
+        print(f"  ✓ {', '.join(reused)} unchanged, loaded from {os.path.relpath(cache_path, SCRIPT_DIR)}")
+    return fields
+
+def extract_content_from_repo(repo_root: str = REPO_ROOT, components: List[str] = COMPONENT_FILES,
+                              data: Optional[Dict] = None, logos: bool = True,
+                              cache_path: Optional[str] = CV_DATA_PATH) -> Optional[Dict]:
     """
     Extract content directly from the repository's TSX component files.
     This is more reliable than web scraping.
+    To refresh part of earlier extracted data, pass it as data together with
+    the component files to read again; logos=False skips the logo sync.
+    Unchanged component files are loaded from the cv-data.json intermediate,
+    see extract_components().
     """
     print("\n📂 Reading content from repository files...")
     
     try:
-        # Get the script's directory and navigate to workspace root
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        repo_root = os.path.dirname(script_dir)
+        if data is None:
+            data = {
+                'profile_text_sv': '',
+                'profile_title_sv': '',
+                'experiences': [],
+                'skills': [],
+                'projects': [],
+                'logos': {}
+            }
         
-        data = {
-            'profile_text_sv': '',
-            'profile_text_en': '',
-            'profile_title_sv': '',
-            'profile_title_en': '',
-            'experiences': [],
-            'skills': [],
-            'projects': [],
-            'logos': {}
-        }
+        for fields in extract_components(repo_root, components, cache_path).values():
+            data.update(fields)
         
-        # Read Hero.tsx for profile text and title
-        hero_path = os.path.join(repo_root, 'components', 'Hero.tsx')
-        if os.path.exists(hero_path):
-            with open(hero_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # Extract the title (subtitle line)
-                title_match = re.search(r'<p className="text-xl.*?>\s*(.+?)\s*</p>', content, re.DOTALL)
-                if title_match:
-                    data['profile_title_sv'] = re.sub(r'\s+', ' ', title_match.group(1)).strip()
-                    data['profile_title_en'] = translate_text(data['profile_title_sv'])
-                    print(f"  ✓ Found profile title")
-                
-                # Extract the Swedish profile text - look for the max-w-2xl paragraph
-                desc_match = re.search(r'<p className="max-w-2xl[^>]*>\s*(.+?)\s*</p>', content, re.DOTALL)
-                if desc_match:
-                    # Extract the text and clean up whitespace
-                    raw_text = desc_match.group(1)
-                    # Remove extra whitespace and newlines but keep sentence structure
-                    data['profile_text_sv'] = re.sub(r'\s+', ' ', raw_text).strip()
-                    print(f"  ✓ Found profile text (Swedish)")
-                    if data['profile_text_sv']:
-                        data['profile_text_en'] = translate_text(data['profile_text_sv'])
-                        print(f"  ✓ Translated profile text to English")
-                    else:
-                        print(f"  ⚠ Profile text was empty after extraction")
-        
-        # Read Experience.tsx for work history
-        exp_path = os.path.join(repo_root, 'components', 'Experience.tsx')
-        if os.path.exists(exp_path):
-            with open(exp_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                experiences = extract_tsx_data(content, 'experiences')
-                data['experiences'] = experiences
-                print(f"  ✓ Extracted {len(experiences)} work experiences")
-        
-        # Read Skills.tsx for skills
-        skills_path = os.path.join(repo_root, 'components', 'Skills.tsx')
-        if os.path.exists(skills_path):
-            with open(skills_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                skills = extract_tsx_data(content, 'skillCategories')
-                data['skills'] = skills
-                print(f"  ✓ Extracted {len(skills)} skill categories")
-        
-        # Read Projects.tsx for projects
-        projects_path = os.path.join(repo_root, 'components', 'Projects.tsx')
-        if os.path.exists(projects_path):
-            with open(projects_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                projects = extract_tsx_data(content, 'projects')
-                data['projects'] = projects
-                print(f"  ✓ Extracted {len(projects)} projects")
-        
-        # Copy logos from public folder to CV directory
-        print("\n📥 Copying company logos...")
-        public_dir = os.path.join(repo_root, 'public')
-        # Use /tmp for dev containers, or the default path if it exists
-        default_logos_dir = '/home/daniel/Music/CV/logos'
-        if os.path.exists('/home/daniel'):
-            logos_dir = default_logos_dir
-        else:
-            # In dev container or other environment, use a temp directory
-            logos_dir = os.path.join(repo_root, 'cv-generator', 'logos')
-        os.makedirs(logos_dir, exist_ok=True)
-        
-        logo_files = {
-            'InfraCom': 'infracom-logo.png',
-            'Redpill Linpro': 'redpill-linpro-logo.png',
-            'T&M Hansson IT': 'hanssonit-logo.png',
-            'SenseNode': 'sensenode-logo.png',
-            'Vessinge IT': 'vessinge-logo.png',
-            'Orestad Linux': 'orestad-logo.png',
-            'HSN Konsult': 'hsn-konsult-logo.jpg'
-        }
-        
-        for company_key, logo_file in logo_files.items():
-            src_path = os.path.join(public_dir, logo_file)
-            dst_path = os.path.join(logos_dir, logo_file)
-            if os.path.exists(src_path):
-                shutil.copy2(src_path, dst_path)
-                data['logos'][company_key] = dst_path
-                print(f"  ✓ {company_key}")
-            else:
-                print(f"  ⚠ Logo not found: {logo_file}")
+        # Sync logos from public folder to CV directory
+        if logos:
+            with profiler.stage('sync logos'):
+                data['logos'] = sync_logos(repo_root)
         
         print("\n✓ Repository content extraction completed successfully")
         return data
@@ -305,109 +1300,47 @@ contact_info = {
     "website": "rekrytera.danielhansson.nu"
 }
 
-# Extract content from repository files
-repo_data = extract_content_from_repo()
-
-# Build data structures from extracted content or use fallbacks
-if repo_data:
-    profile_text_swedish = repo_data.get('profile_text_sv', '')
-    profile_text_english = repo_data.get('profile_text_en', '')
-    profile_header_swedish = repo_data.get('profile_title_sv', 'DATACENTER MANAGER • OPERATIONS ENGINEER')
-    profile_header_english = repo_data.get('profile_title_en', 'DATACENTER MANAGER • OPERATIONS ENGINEER')
-    company_logos = repo_data.get('logos', {})
-    
-    # Convert extracted experiences to the format needed by create_cv
-    work_experience_swedish = []
-    work_experience_english = []
-    
-    for exp in repo_data.get('experiences', []):
-        # Swedish version
-        exp_sv = {
-            'title': exp.get('title', ''),
-            'company': exp.get('company', ''),
-            'location': exp.get('location', ''),
-            'date': exp.get('period', ''),
-            'description': exp.get('description', ''),
-            'keywords': ', '.join(exp.get('skills', [])),
-            'page_break_before': exp.get('highlight', '') == 'Karriärutveckling'  # Add page break for certain entries
-        }
-        work_experience_swedish.append(exp_sv)
-        
-        # English version (translate)
-        exp_en = {
-            'title': translate_text(exp.get('title', '')),
-            'company': exp.get('company', ''),  # Keep company names unchanged
-            'location': exp.get('location', ''),
-            'date': exp.get('period', '').replace('Nuvarande', 'Present').replace('Maj', 'May'),
-            'description': translate_text(exp.get('description', '')),
-            'keywords': ', '.join(exp.get('skills', [])),  # Skills are typically in English already
-            'page_break_before': exp.get('highlight', '') == 'Karriärutveckling'
-        }
-        work_experience_english.append(exp_en)
-    
-    # Convert extracted skills
-    it_skills_swedish = {}
-    it_skills_english = {}
-    
-    for skill_cat in repo_data.get('skills', []):
-        title_sv = skill_cat.get('title', '')
-        title_en = translate_text(title_sv)
-        skills_list = ', '.join(skill_cat.get('skills', []))
-        it_skills_swedish[title_sv] = skills_list
-        it_skills_english[title_en] = skills_list
-    
-    # Convert extracted projects
-    projects_swedish = []
-    projects_english = []
-    
-    for proj in repo_data.get('projects', []):
-        projects_swedish.append({
-            'name': proj.get('title', ''),
-            'desc': proj.get('description', '')
-        })
-        projects_english.append({
-            'name': proj.get('title', ''),  # Keep project names in original
-            'desc': translate_text(proj.get('description', ''))
-        })
-    
-    print("✓ Using dynamically extracted content from repository files")
-else:
-    # Fallback to hardcoded values
-    print("⚠ Using fallback hardcoded content")
-    profile_text_swedish = (
-        "Med passion för automation, stabilitet och kontinuerlig förbättring. "
-        "Kombinerar teknisk expertis inom Linux, virtualisering och infrastruktur med beprövad "
-        "förmåga att leda team och driva moderniserings- och migreringsprojekt. "
-        "Entreprenöriell bakgrund med affärsförståelse och lösningsorienterat mindset."
-    )
-    profile_text_english = (
-        "With a passion for automation, stability, and continuous improvement. Combines "
-        "technical expertise in Linux, virtualization, and infrastructure with proven "
-        "ability to lead teams and drive modernization and migration projects. "
-        "Entrepreneurial background with business understanding and solution-oriented mindset."
-    )
-    profile_header_swedish = "DATACENTER MANAGER • OPERATIONS ENGINEER"
-    profile_header_english = "DATACENTER MANAGER • OPERATIONS ENGINEER"
-    company_logos = {}
-    
-    # Fallback skills and projects  
-    it_skills_swedish = {
-        "Virtualisering & Hypervisors": "VMware vSphere/ESX, Nutanix AHV, Hyper-V, Proxmox VE, HCI",
-        "OS & Servrar": "Linux (Ubuntu/Debian/Alpine), Windows Server, AD, Exchange, Azure, Docker",
-        "Backup & Lagring": "Veeam, Ahsay, Proxmox PBS, Disaster Recovery, HA",
-        "Nätverk & Säkerhet": "VPN, DNS/BIND, Fortigate, opnSense, pfSense, Unifi",
-        "Automation": "Ansible, Bash, PowerShell, VS Code, IaC, Packer, Git"
-    }
-    
-    it_skills_english = {
-        "Virtualization & Hypervisors": "VMware vSphere/ESX, Nutanix AHV, Hyper-V, Proxmox VE, HCI",
-        "OS & Servers": "Linux (Ubuntu/Debian/Alpine), Windows Server, AD, Exchange, Azure, Docker",
-        "Backup & Storage": "Veeam, Ahsay, Proxmox PBS, Disaster Recovery, HA",
-        "Network & Security": "VPN, DNS/BIND, Fortigate, opnSense, pfSense, Unifi",
-        "Automation": "Ansible, Bash, PowerShell, VS Code, IaC, Packer, Git"
-    }
-    
-    work_experience_swedish = [
+# Contact lines of the header paragraph: (label, link target, link text)
+contact_links = [
+    ('Email', 'mailto:mailto@danielhansson.nu', 'mailto@danielhansson.nu'),
+    ('Telephone', 'tel:+46734045555', '+46 734 04 55 55'),
+    ('LinkedIn', 'https://linkedin.com/in/daniel-hansson-7564a490', 'linkedin.com/in/daniel-hansson-7564a490'),
+    ('GitHub', 'https://github.com/enoch85', 'github.com/enoch85'),
+    ('Website', 'https://rekrytera.danielhansson.nu', 'rekrytera.danielhansson.nu')
+]
+
+# Fallback content used when the repository files cannot be read
+fallback_profile_text_swedish = (
+    "Med passion för automation, stabilitet och kontinuerlig förbättring. "
+    "Kombinerar teknisk expertis inom Linux, virtualisering och infrastruktur med beprövad "
+    "förmåga att leda team och driva moderniserings- och migreringsprojekt. "
+    "Entreprenöriell bakgrund med affärsförståelse och lösningsorienterat mindset."
+)
+fallback_profile_text_english = (
+    "With a passion for automation, stability, and continuous improvement. Combines "
+    "technical expertise in Linux, virtualization, and infrastructure with proven "
+    "ability to lead teams and drive modernization and migration projects. "
+    "Entrepreneurial background with business understanding and solution-oriented mindset."
+)
+fallback_profile_header = "DATACENTER MANAGER • OPERATIONS ENGINEER"
+
+fallback_it_skills_swedish = {
+    "Virtualisering & Hypervisors": "VMware vSphere/ESX, Nutanix AHV, Hyper-V, Proxmox VE, HCI",
+    "OS & Servrar": "Linux (Ubuntu/Debian/Alpine), Windows Server, AD, Exchange, Azure, Docker",
+    "Backup & Lagring": "Veeam, Ahsay, Proxmox PBS, Disaster Recovery, HA",
+    "Nätverk & Säkerhet": "VPN, DNS/BIND, Fortigate, opnSense, pfSense, Unifi",
+    "Automation": "Ansible, Bash, PowerShell, VS Code, IaC, Packer, Git"
+}
+
+fallback_it_skills_english = {
+    "Virtualization & Hypervisors": "VMware vSphere/ESX, Nutanix AHV, Hyper-V, Proxmox VE, HCI",
+    "OS & Servers": "Linux (Ubuntu/Debian/Alpine), Windows Server, AD, Exchange, Azure, Docker",
+    "Backup & Storage": "Veeam, Ahsay, Proxmox PBS, Disaster Recovery, HA",
+    "Network & Security": "VPN, DNS/BIND, Fortigate, opnSense, pfSense, Unifi",
+    "Automation": "Ansible, Bash, PowerShell, VS Code, IaC, Packer, Git"
+}
+
+fallback_work_experience_swedish = [
     {
         "title": "Datacenter Manager",
         "company": "InfraCom Smart Digital Solutions",
@@ -497,6 +1430,7 @@ else:
     }
 ]
 
+# The English work history is maintained by hand instead of being machine translated
 work_experience_english = [
     {
         "title": "Datacenter Manager",
@@ -692,6 +1626,154 @@ languages_english = [
     "Portuguese (Beginner)"
 ]
 
+class CVData:
+    """
+    CV content for every language, extracted from the repository on first use.
+    Creating the object is free; the component files are read, logos copied and
+    strings translated the first time one of the content attributes is accessed.
+    The extracted components are cached at cache_path (None disables the cache).
+    """
+    FIELDS = (
+        'profile_header_swedish', 'profile_header_english',
+        'profile_text_swedish', 'profile_text_english',
+        'work_experience_swedish', 'work_experience_english',
+        'it_skills_swedish', 'it_skills_english',
+        'company_logos', 'from_repository'
+    )
+
+    def __init__(self, repo_root: str = REPO_ROOT, translator_factory=None,
+                 cache_path: Optional[str] = CV_DATA_PATH):
+        self.repo_root = repo_root
+        self.translator_factory = translator_factory
+        self.cache_path = cache_path
+        self.repo_data = None
+        self._loaded = False
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set yet
+        if name in CVData.FIELDS and not self._loaded:
+            self.load()
+            return getattr(self, name)
+        raise AttributeError(f"'CVData' object has no attribute '{name}'")
+
+    def load(self):
+        """
+        Extract content from the repository files, falling back to the hardcoded content.
+        """
+        self._loaded = True
+        with profiler.stage('extract content'):
+            self.repo_data = extract_content_from_repo(self.repo_root, cache_path=self.cache_path)
+        return self._build(self.repo_data)
+
+    def reload(self, components: List[str] = (), logos: bool = False):
+        """
+        Read the given component files again (and sync the logos) and rebuild
+        the content from them and the rest of the earlier extracted data.
+        Only strings missing from the translation cache reach the translator.
+        """
+        if not self._loaded or not self.repo_data:
+            return self.load()
+        with profiler.stage('extract content'):
+            repo_data = extract_content_from_repo(self.repo_root, components, dict(self.repo_data), logos,
+                                                  cache_path=self.cache_path)
+        if repo_data:
+            self.repo_data = repo_data
+        return self._build(self.repo_data)
+
+    def _build(self, repo_data: Optional[Dict]):
+        self.from_repository = bool(repo_data)
+        self.work_experience_english = work_experience_english
+        
+        if not repo_data:
+            print("⚠ Using fallback hardcoded content")
+            self.profile_header_swedish = fallback_profile_header
+            self.profile_header_english = fallback_profile_header
+            self.profile_text_swedish = fallback_profile_text_swedish
+            self.profile_text_english = fallback_profile_text_english
+            self.work_experience_swedish = fallback_work_experience_swedish
+            self.it_skills_swedish = fallback_it_skills_swedish
+            self.it_skills_english = fallback_it_skills_english
+            self.company_logos = {}
+            return self
+        
+        # Collect every string that needs an English version and translate them as one batch
+        strings_to_translate = [repo_data['profile_title_sv'], repo_data['profile_text_sv']]
+        for skill_cat in repo_data['skills']:
+            strings_to_translate.append(skill_cat.get('title', ''))
+        
+        print("\n🌐 Translating content to English...")
+        # Every build gets the whole deadline and a closed breaker again
+        translation_breaker.reset()
+        failures_before = translation_failures
+        with profiler.stage('translate'):
+            english = translate_batch(strings_to_translate, translator_factory=self.translator_factory)
+            translation_cache.save()
+        degraded = translation_failures - failures_before
+        if degraded:
+            print(f"  ⚠ Translated {len(english) - degraded} of {len(english)} unique strings, "
+                  f"{degraded} kept (partly) untranslated")
+        else:
+            print(f"  ✓ Translated {len(english)} unique strings")
+        
+        self.profile_header_swedish = repo_data['profile_title_sv'] or fallback_profile_header
+        self.profile_header_english = english[repo_data['profile_title_sv']] or fallback_profile_header
+        self.profile_text_swedish = repo_data['profile_text_sv']
+        self.profile_text_english = english[repo_data['profile_text_sv']]
+        self.company_logos = repo_data['logos']
+        
+        # Convert extracted experiences to the format needed by create_cv
+        self.work_experience_swedish = []
+        for exp in repo_data['experiences']:
+            self.work_experience_swedish.append({
+                'title': exp.get('title', ''),
+                'company': exp.get('company', ''),
+                'location': exp.get('location', ''),
+                'date': exp.get('period', ''),
+                'description': exp.get('description', ''),
+                'keywords': ', '.join(exp.get('skills', [])),
+                'page_break_before': exp.get('highlight', '') == 'Karriärutveckling'  # Add page break for certain entries
+            })
+        
+        # Convert extracted skills
+        self.it_skills_swedish = {}
+        self.it_skills_english = {}
+        for skill_cat in repo_data['skills']:
+            title_sv = skill_cat.get('title', '')
+            skills_list = ', '.join(skill_cat.get('skills', []))
+            self.it_skills_swedish[title_sv] = skills_list
+            self.it_skills_english[english[title_sv]] = skills_list
+        
+        print("✓ Using dynamically extracted content from repository files")
+        return self
+
+    def for_language(self, language: str) -> Dict:
+        """
+        Return the content sections of the CV for 'sv' or 'en'.
+        """
+        if language == 'sv':
+            return {
+                'profile_header': self.profile_header_swedish,
+                'profile_text': self.profile_text_swedish,
+                'key_competencies': key_competencies_swedish,
+                'it_skills': self.it_skills_swedish,
+                'work_experience': self.work_experience_swedish,
+                'education': education_swedish,
+                'certificates': certificates_swedish,
+                'projects': projects_swedish,
+                'languages': languages_swedish
+            }
+        return {
+            'profile_header': self.profile_header_english,
+            'profile_text': self.profile_text_english,
+            'key_competencies': key_competencies_english,
+            'it_skills': self.it_skills_english,
+            'work_experience': self.work_experience_english,
+            'education': education_english,
+            'certificates': certificates_english,
+            'projects': projects_english,
+            'languages': languages_english
+        }
+
 def set_table_borders_to_none(table):
     """
     Removes borders from a table by setting all border elements to nil.
@@ -756,7 +1838,240 @@ def set_table_borders_to_none(table):
                 border.set(qn('w:color'), 'FFFFFF')
                 tcBorders.append(border)
 
-def create_cv(template_path, output_path, image_path, language='en'):
+def normalize_company(name: str) -> str:
+    """
+    Normalize a company name or job title for logo lookup: accents folded,
+    case folded, punctuation dropped and legal-form suffixes removed,
+    e.g. 'Örestad Linux AB' -> 'orestad linux'.
+    """
+    folded = unicodedata.normalize('NFKD', name)
+    folded = ''.join(char for char in folded if not unicodedata.combining(char)).casefold()
+    words = re.findall(r'[\w&]+', folded)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+def build_logo_index(company_logos: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build the normalized name -> logo path index used by resolve_logo(),
+    including the names in LOGO_ALIASES.
+    """
+    index = {normalize_company(key): path for key, path in company_logos.items()}
+    for alias, key in LOGO_ALIASES.items():
+        if key in company_logos:
+            index[normalize_company(alias)] = company_logos[key]
+    return index
+
+def resolve_logo(logo_index: Dict[str, str], job: Dict) -> Optional[str]:
+    """
+    Find the logo for a job: the longest leading run of words of the company
+    name that is in the index (so 'InfraCom Smart Digital Solutions' finds
+    'InfraCom'), or else the job title as an alias.
+    """
+    words = normalize_company(job.get('company', '')).split()
+    for length in range(len(words), 0, -1):
+        logo_path = logo_index.get(' '.join(words[:length]))
+        if logo_path:
+            return logo_path
+    return logo_index.get(normalize_company(job.get('title', '')))
+
+def strip_template_sample(doc):
+    """
+    Remove the template's sample content, keeping its styles and page setup.
+    """
+    # --- 1. Remove the existing table entirely ---
+    if len(doc.tables) > 0:
+        old_table = doc.tables[0]
+        old_table._element.getparent().remove(old_table._element)
+    
+    # --- 2. Clear ALL existing paragraphs after the table ---
+    for p in doc.paragraphs:
+        p._element.getparent().remove(p._element)
+
+class PreparedTemplate:
+    """
+    The Word template opened and stripped of its sample table and paragraphs once.
+    The parts that are the same in every CV, the page number header and the
+    relationships of the contact links, are added to it at the same time.
+    Every render starts from a deep copy of the prepared document, so the zip
+    open, XML parse and element removal are not repeated per render.
+    When pickled (e.g. for worker processes) the prepared package is sent as bytes.
+    """
+
+    def __init__(self, template_bytes: bytes, prepared: bool = False, digest: Optional[str] = None):
+        self.blob = template_bytes
+        # Identifies the template file, the prepared package differs in its zip timestamps
+        self.digest = digest or hashlib.sha256(template_bytes).hexdigest()
+        self._prepared = prepared
+        self._document = None
+        self._fragments = None
+
+    @classmethod
+    def from_file(cls, template_path: str) -> 'PreparedTemplate':
+        with open(template_path, 'rb') as f:
+            template_bytes = f.read()
+        profiler.count('bytes read', len(template_bytes))
+        return cls(template_bytes)
+
+    @property
+    def document(self):
+        if self._document is None:
+            with profiler.stage('template parse'):
+                doc = Document(io.BytesIO(self.blob))
+                if not self._prepared:
+                    strip_template_sample(doc)
+                
+                    # Static content shared by every CV
+                    add_page_numbers(doc)
+                    for _, url, _ in contact_links:
+                        doc.part.relate_to(url, HYPERLINK_RELTYPE, is_external=True)
+                
+                    # Keep the stripped package so copies of this object skip the work
+                    stream = io.BytesIO()
+                    doc.save(stream)
+                    self.blob = stream.getvalue()
+                    self._prepared = True
+                    # Reopen so no proxy objects (like the cached body) are part of what
+                    # gets deep-copied; copying those would detach them from the tree
+                    doc = Document(io.BytesIO(self.blob))
+                self._document = doc
+        return self._document
+
+    @property
+    def fragments(self) -> 'TemplateFragments':
+        if self._fragments is None:
+            self._fragments = TemplateFragments(self.document)
+        return self._fragments
+
+    def new_document(self):
+        """
+        Return a fresh, independent copy of the prepared template document.
+        """
+        return copy.deepcopy(self.document)
+
+    def __getstate__(self):
+        self.document
+        return {'blob': self.blob, 'digest': self.digest, '_prepared': True, '_document': None,
+                '_fragments': None}
+
+_has_pillow = None
+
+def has_pillow() -> bool:
+    """
+    Check once whether Pillow is installed, warning if it is not.
+    """
+    global _has_pillow
+    if _has_pillow is None:
+        _has_pillow = importlib.util.find_spec('PIL') is not None
+        if not _has_pillow:
+            print("⚠ Pillow not installed. Install with: pip install Pillow")
+            print("  Images will be embedded at full resolution.")
+    return _has_pillow
+
+def optimize_image(data: bytes, width: Optional[int] = None, height: Optional[int] = None,
+                   dpi: int = IMAGE_DPI) -> bytes:
+    """
+    Downsample an image to what its printed size (EMU width or height) needs at
+    the given DPI and recompress it. Results are cached on disk by source hash
+    and settings. Returns the original bytes when that is already smaller or
+    when Pillow is not available.
+    """
+    if dpi <= 0 or not has_pillow():
+        return data
+    
+    settings = f"{width}x{height}@{dpi}:{IMAGE_JPEG_QUALITY}"
+    key = hashlib.sha256(data + settings.encode('ascii')).hexdigest()
+    cache_path = os.path.join(ASSET_CACHE_DIR, key)
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return f.read()
+    
+    from PIL import Image
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image_format = image.format
+            # Target size in pixels, never upscaled
+            if width is not None:
+                scale = width / Inches(1) * dpi / image.width
+            else:
+                scale = height / Inches(1) * dpi / image.height
+            if scale < 1:
+                size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+                image = image.resize(size, Image.LANCZOS)
+            
+            stream = io.BytesIO()
+            if image_format == 'JPEG':
+                image.convert('RGB').save(stream, 'JPEG', quality=IMAGE_JPEG_QUALITY, optimize=True,
+                                          progressive=True, dpi=(dpi, dpi))
+            else:
+                image.save(stream, 'PNG', optimize=True, dpi=(dpi, dpi))
+            optimized = stream.getvalue()
+    except Exception as e:
+        print(f"  ⚠ Could not optimize image: {e}")
+        return data
+    
+    if len(optimized) >= len(data):
+        optimized = data
+    os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+    with open(cache_path + '.tmp', 'wb') as f:
+        f.write(optimized)
+    os.replace(cache_path + '.tmp', cache_path)
+    return optimized
+
+class RenderInputs:
+    """
+    Template, profile image and logo bytes, read from disk once and shared by
+    every render (including renders in worker processes). Images are
+    downsampled to their printed size at image_dpi (0 keeps the originals),
+    and documents are saved with XML parts deflated at deflate_level. With a
+    build_date (seconds since the epoch) they are saved reproducibly, dated
+    at that time.
+    """
+
+    def __init__(self, template_path: str, image_path: str, company_logos: Dict[str, str],
+                 image_dpi: int = IMAGE_DPI, template: Optional[PreparedTemplate] = None,
+                 deflate_level: int = DOCX_DEFLATE_LEVEL, build_date: Optional[int] = None):
+        self.template = template or PreparedTemplate.from_file(template_path)
+        self.image_dpi = image_dpi
+        self.deflate_level = deflate_level
+        self.build_date = build_date
+        self.image_sizes = {}
+        self.image = None
+        self.image_name = os.path.basename(image_path)
+        self.company_logos = dict(company_logos)
+        self.logo_index = build_logo_index(self.company_logos)
+        self.logos = {}
+        with profiler.stage('load images'):
+            if os.path.exists(image_path):
+                self.image = self._load_image(image_path, width=PROFILE_IMAGE_WIDTH)
+            for logo_path in self.company_logos.values():
+                self.read_logo(logo_path)
+
+    def _load_image(self, path: str, width: Optional[int] = None, height: Optional[int] = None) -> bytes:
+        with open(path, 'rb') as f:
+            data = f.read()
+        profiler.count('bytes read', len(data))
+        optimized = optimize_image(data, width=width, height=height, dpi=self.image_dpi)
+        self.image_sizes[os.path.basename(path)] = (len(data), len(optimized))
+        return optimized
+
+    def read_logo(self, logo_path: str) -> Optional[bytes]:
+        if logo_path not in self.logos and os.path.exists(logo_path):
+            self.logos[logo_path] = self._load_image(logo_path, height=LOGO_HEIGHT)
+        return self.logos.get(logo_path)
+
+    def report_image_savings(self):
+        before = sum(original for original, _ in self.image_sizes.values())
+        after = sum(optimized for _, optimized in self.image_sizes.values())
+        if not before or before == after:
+            return
+        print(f"\n🖼  Optimized {len(self.image_sizes)} images for {self.image_dpi} DPI:")
+        for name, (original, optimized) in sorted(self.image_sizes.items()):
+            print(f"  ✓ {name}: {original / 1024:.0f} KB → {optimized / 1024:.0f} KB")
+        print(f"  ✓ Saved {(before - after) / 1024:.0f} KB per document ({(before - after) / before:.0%})")
+
+def create_cv(template_path, output_path, image_path, language='en', data: Optional[CVData] = None,
+              fast: bool = False):
     """
     Create a CV document in the specified language.
     
@@ -765,92 +2080,236 @@ def create_cv(template_path, output_path, image_path, language='en'):
         output_path: Where to save the generated CV
         image_path: Path to profile image
         language: 'sv' for Swedish or 'en' for English
+        data: CVData with the CV content, loaded from the repository if omitted
+        fast: Write the document body as XML in one pass (see write_body_xml)
+    """
+    if data is None:
+        data = CVData()
+    inputs = RenderInputs(template_path, image_path, data.company_logos)
+    render_cv(inputs, data.for_language(language), output_path, language, fast)
+
+def render_cv(inputs: RenderInputs, content: Dict, output_path: str, language: str = 'en',
+              fast: bool = False):
+    """
+    Render and save one CV from preloaded inputs and the content of one language
+    (as returned by CVData.for_language). The fast render mode reuses the XML
+    of unchanged sections from the section cache.
+    """
+    doc = build_document(inputs, content, language, fast, cache=section_cache)
+    start = time.perf_counter()
+    with profiler.stage('doc.save'):
+        save_docx(doc, output_path, inputs.deflate_level, inputs.build_date)
+    size = os.path.getsize(output_path)
+    profiler.count('bytes written', size)
+    print(f"✓ CV saved to {output_path} ({size / 1024:.0f} KB in {(time.perf_counter() - start) * 1000:.0f} ms)")
+
+def source_date_epoch() -> Optional[int]:
+    """
+    Return the SOURCE_DATE_EPOCH environment variable (reproducible-builds.org)
+    as an integer, or None if it is not set or not valid.
+    """
+    value = os.environ.get('SOURCE_DATE_EPOCH')
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        print(f"⚠ Ignoring SOURCE_DATE_EPOCH={value!r}, it is not a number of seconds")
+        return None
+
+def normalize_core_properties(doc, build_date: int):
+    """
+    Date a document's core properties at build_date instead of the template's
+    times, and drop what only described the template (revision, last printed).
+    """
+    from datetime import datetime, timezone
+    date = datetime.fromtimestamp(build_date, timezone.utc).replace(tzinfo=None)
+    properties = doc.core_properties
+    properties.created = date
+    properties.modified = date
+    properties.revision = 1
+    last_printed = properties._element.lastPrinted
+    if last_printed is not None:
+        properties._element.remove(last_printed)
+
+_has_package_writer = None
+
+def has_package_writer() -> bool:
+    """
+    Check once whether python-docx has the package writer internals write_docx()
+    builds on (Part.before_marshal and pkgwriter._ContentTypesItem), warning if
+    it does not.
+    """
+    global _has_package_writer
+    if _has_package_writer is None:
+        try:
+            from docx.opc.part import Part
+            from docx.opc.pkgwriter import _ContentTypesItem
+            _has_package_writer = hasattr(Part, 'before_marshal') and hasattr(_ContentTypesItem, 'from_parts')
+        except ImportError:
+            _has_package_writer = False
+        if not _has_package_writer:
+            print("⚠ Unsupported python-docx version, .docx files will be saved and then recompressed.")
+    return _has_package_writer
+
+def write_docx(doc, file, deflate_level: int = DOCX_DEFLATE_LEVEL, build_date: Optional[int] = None):
+    """
+    Write a document's package as .docx to a path or binary stream in one pass,
+    like doc.save() but with a compression policy per part: JPEG, PNG and GIF
+    media is stored, since deflating it again only costs time, and every other
+    part is deflated at deflate_level (0 stores everything).
+    
+    With a build_date the package is reproducible: identical documents give
+    identical bytes. Every entry is dated at build_date, parts are written in
+    part name order and the core properties are normalized. Relationship ids
+    and drawing ids need no extra work, they are numbered in document order.
+    
+    If python-docx lacks the internals this relies on, the package written by
+    doc.save() is re-zipped with the same policy instead.
+    """
+    from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    package = doc.part.package
+    if build_date is None:
+        parts = package.parts
+        date_time = time.localtime()[:6]
+    else:
+        normalize_core_properties(doc, build_date)
+        parts = sorted(package.parts, key=lambda part: part.partname)
+        date_time = time.gmtime(max(build_date, REPRODUCIBLE_EPOCH))[:6]
+    
+    with zipfile.ZipFile(file, 'w') as archive:
+        def write(membername, blob, content_type=None):
+            entry = zipfile.ZipInfo(membername, date_time)
+            # Do not record the platform the package was written on
+            entry.create_system = 0
+            if deflate_level and content_type not in DOCX_STORED_CONTENT_TYPES:
+                entry.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(entry, blob, compresslevel=deflate_level)
+            else:
+                archive.writestr(entry, blob)
+            profiler.count(f'parts {"deflated" if entry.compress_type else "stored"}')
+        
+        if not has_package_writer():
+            content_types = {part.partname.membername: part.content_type for part in parts}
+            saved = io.BytesIO()
+            doc.save(saved)
+            with zipfile.ZipFile(saved) as package_zip:
+                names = package_zip.namelist()
+                if build_date is not None:
+                    names.sort(key=lambda name: (name != CONTENT_TYPES_URI.membername, name))
+                for name in names:
+                    write(name, package_zip.read(name), content_types.get(name))
+            return
+        
+        from docx.opc.pkgwriter import _ContentTypesItem
+        for part in parts:
+            part.before_marshal()
+        write(CONTENT_TYPES_URI.membername, _ContentTypesItem.from_parts(parts).blob)
+        write(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+        for part in parts:
+            write(part.partname.membername, part.blob, part.content_type)
+            if len(part.rels):
+                write(part.partname.rels_uri.membername, part.rels.xml)
+
+def save_docx(doc, output_path: str, deflate_level: int = DOCX_DEFLATE_LEVEL, build_date: Optional[int] = None):
+    """
+    Save a document with write_docx() to a temporary file next to output_path
+    and rename it into place, so readers never see a partly written .docx.
+    """
+    # Render worker processes may save at the same time
+    tmp_path = f'{output_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            write_docx(doc, f, deflate_level, build_date)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def build_document(inputs: RenderInputs, content: Dict, language: str = 'en', fast: bool = False,
+                   cache: Optional['SectionCache'] = None):
+    """
+    Build one CV document in memory. With fast=True the body is written as
+    OOXML text in one pass (write_body_xml) instead of through python-docx
+    objects (add_body); both produce the same document. The section cache
+    is only used by the fast render mode.
+    """
+    with profiler.stage(f'render {language}'):
+        # Steps 1 and 2 (removing the sample table and paragraphs) are done once by PreparedTemplate,
+        profiler.section('Template copy')
+        doc = inputs.template.new_document()
+        # The page number header is part of the prepared template
+        if fast:
+            write_body_xml(doc, inputs, content, language, cache)
+        else:
+            add_body(doc, inputs, content, language)
+    return doc
+
+# Floating profile picture, positioned at top right with margin so text wraps around it
+PROFILE_IMAGE_ANCHOR_XML = (
+    '<wp:anchor xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'distT="0" distB="0" distL="114300" distR="114300" simplePos="0" relativeHeight="251658240" '
+    'behindDoc="0" locked="0" layoutInCell="1" allowOverlap="1">'
+    '<wp:simplePos x="0" y="0"/>'
+    '<wp:positionH relativeFrom="page">'
+    '<wp:posOffset>4900000</wp:posOffset>'
+    '</wp:positionH>'
+    '<wp:positionV relativeFrom="page">'
+    '<wp:posOffset>900000</wp:posOffset>'
+    '</wp:positionV>'
+    '<wp:extent cx="{cx}" cy="{cy}"/>'
+    '<wp:effectExtent l="0" t="0" r="0" b="0"/>'
+    '<wp:wrapSquare wrapText="left"/>'
+    '<wp:docPr id="1" name="Picture 1"/>'
+    '<wp:cNvGraphicFramePr/>'
+    '{graphic}'
+    '</wp:anchor>'
+)
+
+def add_body(doc, inputs: RenderInputs, content: Dict, language: str = 'en'):
+    """
+    Add the CV content to a prepared template document through python-docx.
     """
-    doc = Document(template_path)
-    
     # Select data based on language
-    if language == 'sv':
-        profile_header = profile_header_swedish
-        profile_text = profile_text_swedish
-        key_competencies = key_competencies_swedish
-        it_skills = it_skills_swedish
-        work_experience = work_experience_swedish
-        education = education_swedish
-        certificates = certificates_swedish
-        projects = projects_swedish
-        languages_list = languages_swedish
-        work_exp_header = "ARBETSLIVSERFARENHET"
-        competencies_header = "NYCKELKOMPETENSER"
-        education_header = "UTBILDNING"
-        certificates_header = "Certifieringar:"
-        skills_header = "IT-KOMPETENS"
-        languages_header = "SPRÅK"
-        projects_header = "PROJEKT & OPEN SOURCE"
-    else:  # English
-        profile_header = profile_header_english
-        profile_text = profile_text_english
-        key_competencies = key_competencies_english
-        it_skills = it_skills_english
-        work_experience = work_experience_english
-        education = education_english
-        certificates = certificates_english
-        projects = projects_english
-        languages_list = languages_english
-        work_exp_header = "WORK EXPERIENCE"
-        competencies_header = "KEY COMPETENCIES"
-        education_header = "EDUCATION"
-        certificates_header = "Certificates:"
-        skills_header = "IT SKILLS"
-        languages_header = "LANGUAGES"
-        projects_header = "PROJECTS & OPEN SOURCE"
-    
-    # --- 1. Remove the existing table entirely ---
-    if len(doc.tables) > 0:
-        old_table = doc.tables[0]
-        old_table._element.getparent().remove(old_table._element)
-    
-    # --- 2. Clear ALL existing paragraphs after the table ---
-    for p in doc.paragraphs:
-        p._element.getparent().remove(p._element)
+    profile_header = content['profile_header']
+    profile_text = content['profile_text']
+    key_competencies = content['key_competencies']
+    it_skills = content['it_skills']
+    work_experience = content['work_experience']
+    education = content['education']
+    certificates = content['certificates']
+    projects = content['projects']
+    languages_list = content['languages']
+    headers = LANGUAGES[language]['headers']
+    work_exp_header = headers['work_experience']
+    competencies_header = headers['competencies']
+    education_header = headers['education']
+    certificates_header = headers['certificates']
+    skills_header = headers['skills']
+    languages_header = headers['languages']
+    projects_header = headers['projects']
     
     # --- 3. Create header using a paragraph with floating image ---
+    profiler.section('Header')
     
     # Name (large, bold) - First paragraph with image
     p = doc.add_paragraph()
     
     # Add image first with text wrapping (Square/Tight wrapping, anchored to right)
-    if os.path.exists(image_path):
+    if inputs.image is not None:
         run = p.add_run()
-        inline_shape = run.add_picture(image_path, width=Inches(1.9))
+        inline_shape = add_picture(run, inputs.image, inputs.image_name, width=PROFILE_IMAGE_WIDTH)
         
         # Convert inline image to floating (anchored) image
         # This allows text to wrap around it
         from docx.oxml import parse_xml
-        from docx.oxml.ns import nsdecls
         
         # Get the inline shape element
         inline = inline_shape._inline
         
-        # Create anchor element for floating image - positioned at top right with margin
-        anchor_xml = (
-            '<wp:anchor xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
-            'distT="0" distB="0" distL="114300" distR="114300" simplePos="0" relativeHeight="251658240" '
-            'behindDoc="0" locked="0" layoutInCell="1" allowOverlap="1">'
-            '<wp:simplePos x="0" y="0"/>'
-            '<wp:positionH relativeFrom="page">'
-            '<wp:posOffset>4900000</wp:posOffset>'
-            '</wp:positionH>'
-            '<wp:positionV relativeFrom="page">'
-            '<wp:posOffset>900000</wp:posOffset>'
-            '</wp:positionV>'
-            '<wp:extent cx="{cx}" cy="{cy}"/>'
-            '<wp:effectExtent l="0" t="0" r="0" b="0"/>'
-            '<wp:wrapSquare wrapText="left"/>'
-            '<wp:docPr id="1" name="Picture 1"/>'
-            '<wp:cNvGraphicFramePr/>'
-            '{graphic}'
-            '</wp:anchor>'
-        ).format(
+        # Create anchor element for floating image
+        anchor_xml = PROFILE_IMAGE_ANCHOR_XML.format(
             cx=inline.extent.cx,
             cy=inline.extent.cy,
             graphic=inline.graphic.xml.decode() if isinstance(inline.graphic.xml, bytes) else str(inline.graphic.xml)
@@ -859,137 +2318,53 @@ def create_cv(template_path, output_path, image_path, language='en'):
         anchor = parse_xml(anchor_xml)
         inline.getparent().replace(inline, anchor)
     
-    # Now add the text content
-    runner = p.add_run(contact_info["name"])
-    runner.bold = True
-    runner.font.size = Pt(16)
-    p.paragraph_format.space_after = Pt(0)
-    p.add_run('\n')
-    
-    # Contact info - all in one paragraph with line breaks
-    p.add_run('Email: ')
-    add_hyperlink(p, 'mailto:mailto@danielhansson.nu', 'mailto@danielhansson.nu')
-    p.add_run('\n')
-    
-    p.add_run('Telephone: ')
-    add_hyperlink(p, 'tel:+46734045555', '+46 734 04 55 55')
-    p.add_run('\n')
-    
-    p.add_run('LinkedIn: ')
-    add_hyperlink(p, 'https://linkedin.com/in/daniel-hansson-7564a490', 'linkedin.com/in/daniel-hansson-7564a490')
-    p.add_run('\n')
-    
-    p.add_run('GitHub: ')
-    add_hyperlink(p, 'https://github.com/enoch85', 'github.com/enoch85')
-    p.add_run('\n')
-    
-    p.add_run('Website: ')
-    add_hyperlink(p, 'https://rekrytera.danielhansson.nu', 'rekrytera.danielhansson.nu')
-    p.add_run('\n')
-    
-    p.add_run('Location: ')
-    p.add_run(contact_info['location'])
+    # Now add the text content: name and contact info, all in one paragraph
+    # with line breaks, built once per template
+    for element in inputs.template.fragments.contact_elements:
+        p._p.append(copy.deepcopy(element))
     p.paragraph_format.space_after = Pt(12)
         
     # --- 3. Rebuild Content (Compact) ---
     
+    # Styles are looked up once per document instead of by name for every paragraph
+    heading_style = doc.styles['Heading 2']
+    try:
+        bullet_style = doc.styles['List Bullet']
+    except KeyError:
+        bullet_style = None
+    
     def add_header(text):
-        p = doc.add_paragraph(text)
-        p.style = 'Heading 2'
+        p = doc.add_paragraph(text, heading_style)
         p.runs[0].bold = True
         p.runs[0].font.all_caps = True
         p.paragraph_format.space_before = Pt(6)
         p.paragraph_format.space_after = Pt(3)
         return p
+    
+    def add_bullet(text):
+        p = doc.add_paragraph(text, bullet_style) if bullet_style is not None else doc.add_paragraph(f"• {text}")
+        p.paragraph_format.space_after = Pt(0)
 
     # Profile
+    profiler.section('Profile')
     add_header(profile_header)
     p = doc.add_paragraph(profile_text)
     p.paragraph_format.space_after = Pt(0)
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
 
     # Key Competencies
+    profiler.section('Key Competencies')
     add_header(competencies_header)
     for comp in key_competencies:
-        p = doc.add_paragraph(comp)
-        try:
-            p.style = 'List Bullet'
-        except KeyError:
-            p.text = f"• {comp}"
-        p.paragraph_format.space_after = Pt(0)
+        add_bullet(comp)
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
 
     # Work Experience
+    profiler.section('Work Experience')
     add_header(work_exp_header)
     
-    # Download logos on the fly for each job
     for job in work_experience:
-        # Check if we have a logo for this company - download if needed
-        logo_path = None
-        # Map "Previous Sales Career" to HSN Konsult logo
-        if 'Previous Sales Career' in job['title']:
-            company_key = 'HSN Konsult'
-            if company_key not in company_logos:
-                # Download HSN Konsult logo
-                try:
-                    response_web = requests.get("https://rekrytera.danielhansson.nu", timeout=5)
-                    soup_web = BeautifulSoup(response_web.text, 'html.parser')
-                    imgs = soup_web.find_all('img', alt=True)
-                    for img in imgs:
-                        if company_key.lower() in img.get('alt', '').lower():
-                            src = img.get('src')
-                            if src:
-                                ext = src.split('.')[-1] if '.' in src else 'png'
-                                logo_file = company_key.lower().replace(' ', '-') + f'-logo.{ext}'
-                                downloaded = download_logo(src, logo_file)
-                                if downloaded:
-                                    company_logos[company_key] = downloaded
-                                    print(f"  ✓ Downloaded {company_key} logo")
-                                break
-                except:
-                    pass
-            
-            if company_key in company_logos:
-                logo_path = company_logos[company_key]
-        else:
-            # Regular company matching
-            for company_key in ['InfraCom', 'Redpill Linpro', 'T&M Hansson IT', 'SenseNode', 'Vessinge IT', 'Örestad Linux']:
-                # For Örestad, also check the 'Orestad Linux' key used in website alt text
-                logo_key = 'Orestad Linux' if company_key == 'Örestad Linux' else company_key
-                
-                if company_key.lower() in job['company'].lower():
-                    # Check if already in company_logos dict (using website's alt text key)
-                    if logo_key in company_logos:
-                        logo_path = company_logos[logo_key]
-                    elif company_key not in company_logos:
-                        # Try to load from file or download
-                        logo_filename = 'orestad-logo.png' if company_key == 'Örestad Linux' else company_key.lower().replace(' ', '-') + '-logo.png'
-                        logo_filepath = os.path.join(os.path.dirname(__file__), '..', 'logos', logo_filename)
-                        if os.path.exists(logo_filepath):
-                            company_logos[company_key] = logo_filepath
-                            logo_path = logo_filepath
-                            print(f"  ✓ Using existing {company_key} logo")
-                        else:
-                            # Try to download from website
-                            try:
-                                response_web = requests.get("https://rekrytera.danielhansson.nu", timeout=5)
-                                soup_web = BeautifulSoup(response_web.text, 'html.parser')
-                                imgs = soup_web.find_all('img', alt=True)
-                                for img in imgs:
-                                    if company_key.lower() in img.get('alt', '').lower():
-                                        src = img.get('src')
-                                        if src:
-                                            ext = src.split('.')[-1] if '.' in src else 'png'
-                                            logo_file = company_key.lower().replace(' ', '-') + f'-logo.{ext}'
-                                            downloaded = download_logo(src, logo_file)
-                                            if downloaded:
-                                                company_logos[company_key] = downloaded
-                                                logo_path = downloaded
-                                                print(f"  ✓ Downloaded {company_key} logo")
-                                            break
-                            except:
-                                pass
-                    break
+        logo_path = resolve_logo(inputs.logo_index, job)
         
         # Add page break if specified
         if job.get('page_break_before', False):
@@ -1000,10 +2375,11 @@ def create_cv(template_path, output_path, image_path, language='en'):
         p.paragraph_format.space_after = Pt(0)
         
         # Add logo if available (bigger size)
-        if logo_path and os.path.exists(logo_path):
+        logo_data = inputs.read_logo(logo_path) if logo_path else None
+        if logo_data:
             try:
                 run = p.add_run()
-                run.add_picture(logo_path, height=Inches(0.35))  # Bigger logo
+                add_picture(run, logo_data, os.path.basename(logo_path), height=LOGO_HEIGHT)  # Bigger logo
                 p.add_run("  ")  # Space after logo
             except Exception as e:
                 print(f"  ⚠ Could not add logo for {job['company']}: {e}")
@@ -1042,6 +2418,7 @@ def create_cv(template_path, output_path, image_path, language='en'):
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
 
     # Education
+    profiler.section('Education')
     add_header(education_header)
     for edu in education:
         p = doc.add_paragraph()
@@ -1058,22 +2435,19 @@ def create_cv(template_path, output_path, image_path, language='en'):
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
     
     # Certificates (Bullet Points)
+    profiler.section('Certificates')
     p = doc.add_paragraph(certificates_header)
     p.runs[0].bold = True
     p.paragraph_format.space_before = Pt(0)
     p.paragraph_format.space_after = Pt(3)
     
     for cert in certificates:
-        p = doc.add_paragraph(cert)
-        try:
-            p.style = 'List Bullet'
-        except KeyError:
-            p.text = f"• {cert}"
-        p.paragraph_format.space_after = Pt(0)
+        add_bullet(cert)
     
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
 
     # IT Skills
+    profiler.section('IT Skills')
     add_header(skills_header)
     for cat, skills in it_skills.items():
         p = doc.add_paragraph()
@@ -1083,17 +2457,14 @@ def create_cv(template_path, output_path, image_path, language='en'):
         p.add_run(skills)
 
     # Languages (Bullet Points)
+    profiler.section('Languages')
     add_header(languages_header)
     for l in languages_list:
-        p = doc.add_paragraph(l)
-        try:
-            p.style = 'List Bullet'
-        except KeyError:
-            p.text = f"• {l}"
-        p.paragraph_format.space_after = Pt(0)
+        add_bullet(l)
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
 
     # Projects
+    profiler.section('Projects')
     add_header(projects_header)
     for proj in projects:
         p = doc.add_paragraph()
@@ -1103,7 +2474,435 @@ def create_cv(template_path, output_path, image_path, language='en'):
         p.add_run(f": {proj['desc']}")
     doc.add_paragraph("").paragraph_format.space_after = Pt(6)
 
-    # Add page numbering to header
+# Tabs and line breaks in run text, which python-docx writes as w:tab and w:br
+_RUN_BREAK_RE = re.compile(r'([\t\r\n])')
+
+# Defined here rather than imported, xml.sax.saxutils pulls in urllib and ssl
+_XML_TEXT_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_XML_ATTRIBUTE_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+def xml_escape(text: str, quote: bool = False) -> str:
+    """
+    Escape text for element content, or with quote=True for a double-quoted attribute.
+    """
+    return text.translate(_XML_ATTRIBUTE_ESCAPES if quote else _XML_TEXT_ESCAPES)
+
+@functools.lru_cache(maxsize=None)
+def run_properties_xml(bold: bool = False, italic: bool = False, caps: bool = False,
+                       size=None, style: Optional[str] = None) -> str:
+    """
+    The w:rPr fragment of a run, built once per combination of properties.
+    """
+    properties = ''
+    if style:
+        properties += f'<w:rStyle w:val="{xml_escape(style, quote=True)}"/>'
+    if bold:
+        properties += '<w:b/>'
+    if italic:
+        properties += '<w:i/>'
+    if caps:
+        properties += '<w:caps/>'
+    if size is not None:
+        properties += f'<w:sz w:val="{int(size.pt * 2)}"/>'
+    return f'<w:rPr>{properties}</w:rPr>' if properties else ''
+
+@functools.lru_cache(maxsize=None)
+def paragraph_properties_xml(style: Optional[str] = None, space_before=None, space_after=None) -> str:
+    """
+    The w:pPr fragment of a paragraph, built once per combination of properties.
+    """
+    properties = ''
+    if style:
+        properties += f'<w:pStyle w:val="{xml_escape(style, quote=True)}"/>'
+    if space_before is not None or space_after is not None:
+        properties += '<w:spacing'
+        if space_before is not None:
+            properties += f' w:before="{space_before.twips}"'
+        if space_after is not None:
+            properties += f' w:after="{space_after.twips}"'
+        properties += '/>'
+    return f'<w:pPr>{properties}</w:pPr>' if properties else ''
+
+class TemplateFragments:
+    """
+    Formatting resolved once per prepared template for both render modes:
+    paragraph style ids by name, and the static contact block of the header
+    paragraph. Its hyperlink relationships are part of the prepared template
+    (see PreparedTemplate), so every copy of it shares their ids and the
+    block can be copied into each document as is.
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._style_ids = {}
+        runs = [BodyWriter.run(contact_info['name'], bold=True, size=Pt(16)), BodyWriter.run('\n')]
+        for label, url, text in contact_links:
+            r_id = doc.part.relate_to(url, HYPERLINK_RELTYPE, is_external=True)
+            runs.extend((BodyWriter.run(f'{label}: '),
+                         f'<w:hyperlink r:id="{r_id}">{BodyWriter.run(text, style="Hyperlink")}</w:hyperlink>',
+                         BodyWriter.run('\n')))
+        runs.extend((BodyWriter.run('Location: '), BodyWriter.run(contact_info['location'])))
+        self.contact_runs = ''.join(runs)
+        self._contact_elements = None
+
+    def style_id(self, name: str) -> Optional[str]:
+        """
+        Style id of a paragraph style by name, None for the default style.
+        Raises KeyError like paragraph.style = name when the template lacks it.
+        """
+        if name not in self._style_ids:
+            from docx.enum.style import WD_STYLE_TYPE
+            style = self.doc.styles[name]
+            is_default = style == self.doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+            self._style_ids[name] = None if is_default else style.style_id
+        return self._style_ids[name]
+
+    @property
+    def contact_elements(self) -> List:
+        """
+        The contact block as parsed elements, to be deep-copied into a paragraph.
+        """
+        if self._contact_elements is None:
+            from docx.oxml import parse_xml
+            from docx.oxml.ns import nsdecls
+            self._contact_elements = list(parse_xml(f'<w:p {nsdecls("w", "r")}>{self.contact_runs}</w:p>'))
+        return self._contact_elements
+
+class SectionCache(DiskCache):
+    """
+    Persistent on-disk cache of the OOXML the fast render mode writes per CV
+    section, keyed on a hash of the section's data, the language and the
+    prepared template. The XML refers to pictures through placeholders that
+    BodyWriter.splice() resolves, so it is independent of the relationship
+    and shape ids of the document it ends up in.
+    Bump VERSION whenever BodyWriter or write_body_xml() change their output.
+    """
+    NAME = 'section cache'
+
+    def __init__(self, path: str = SECTION_CACHE_PATH,
+                 max_bytes: int = SECTION_CACHE_MAX_BYTES, enabled: bool = True):
+        super().__init__(path, max_bytes, enabled)
+
+    @staticmethod
+    def make_key(section: str, language: str, template: str, data) -> str:
+        payload = json.dumps([section, language, template, data], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        return self._get(key)
+
+    def put(self, key: str, xml: str):
+        self._put(key, xml)
+
+section_cache = SectionCache()
+
+# Placeholders in written XML for what depends on the document: the
+# relationship id of a picture and the shape properties (id and name)
+_IMAGE_PLACEHOLDER = '\x01image:{}\x01'
+_SHAPE_PLACEHOLDER = '\x01docPr\x01'
+_PLACEHOLDER_RE = re.compile('\x01(?:image:([0-9a-f]+)|docPr)\x01')
+
+class BodyWriter:
+    """
+    Writes w:body content as OOXML text for the fast render mode, from string
+    templates of the elements python-docx would create. Style ids and static
+    fragments come from the template's TemplateFragments. Pictures are written
+    with placeholders for their relationship and shape ids, which splice()
+    resolves through the document's part in document order before parsing the
+    text and inserting it into the document in one go. Sections can be copied
+    from a SectionCache instead of being written again, see section().
+    """
+
+    def __init__(self, doc, fragments: Optional[TemplateFragments] = None):
+        self.doc = doc
+        self.part = doc.part
+        self.fragments = fragments or TemplateFragments(doc)
+        self.xml = []
+        self._images = {}
+        self._dimensions = {}
+
+    def style_id(self, name: str) -> Optional[str]:
+        """
+        Style id of a paragraph style by name, see TemplateFragments.style_id.
+        """
+        return self.fragments.style_id(name)
+
+    @staticmethod
+    def run(text: str, bold: bool = False, italic: bool = False, caps: bool = False,
+            size=None, style: Optional[str] = None) -> str:
+        """
+        A w:r element with text, the way run.text writes it.
+        """
+        parts = ['<w:r>', run_properties_xml(bold, italic, caps, size, style)]
+        for piece in _RUN_BREAK_RE.split(text):
+            if piece == '\t':
+                parts.append('<w:tab/>')
+            elif piece in ('\r', '\n'):
+                parts.append('<w:br/>')
+            elif piece:
+                space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+                parts.append(f'<w:t{space}>{xml_escape(piece)}</w:t>')
+        parts.append('</w:r>')
+        return ''.join(parts)
+
+    def hyperlink(self, url: str, text: str) -> str:
+        """
+        A w:hyperlink element, like add_hyperlink().
+        """
+        r_id = self.part.relate_to(url, HYPERLINK_RELTYPE, is_external=True)
+        return f'<w:hyperlink r:id="{r_id}">{self.run(text, style="Hyperlink")}</w:hyperlink>'
+
+    def image_ref(self, image_data: bytes) -> str:
+        """
+        Register a picture for splice() and return the reference its placeholder uses.
+        """
+        ref = hashlib.sha256(image_data).hexdigest()
+        self._images[ref] = image_data
+        return ref
+
+    def _image(self, image_data: bytes, width=None, height=None):
+        ref = self.image_ref(image_data)
+        if (ref, width, height) not in self._dimensions:
+            from docx.image.image import Image
+            self._dimensions[ref, width, height] = Image.from_blob(image_data).scaled_dimensions(width, height)
+        cx, cy = self._dimensions[ref, width, height]
+        return _IMAGE_PLACEHOLDER.format(ref), cx, cy
+
+    @staticmethod
+    def _graphic(r_id: str, name: str, cx: int, cy: int) -> str:
+        return (
+            '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            '<pic:pic><pic:nvPicPr>'
+            f'<pic:cNvPr id="0" name="{xml_escape(name, quote=True)}"/><pic:cNvPicPr/>'
+            f'</pic:nvPicPr><pic:blipFill><a:blip r:embed="{r_id}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+            f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm><a:prstGeom prst="rect"/></pic:spPr>'
+            '</pic:pic></a:graphicData></a:graphic>'
+        )
+
+    def picture(self, image_data: bytes, name: str, width=None, height=None) -> str:
+        """
+        A w:r with an inline picture, like add_picture().
+        """
+        r_id, cx, cy = self._image(image_data, width, height)
+        return (
+            f'<w:r><w:drawing><wp:inline><wp:extent cx="{cx}" cy="{cy}"/>{_SHAPE_PLACEHOLDER}'
+            '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+            f'{self._graphic(r_id, name, cx, cy)}</wp:inline></w:drawing></w:r>'
+        )
+
+    def floating_picture(self, image_data: bytes, name: str, width=None, height=None) -> str:
+        """
+        A w:r with the floating profile picture (PROFILE_IMAGE_ANCHOR_XML).
+        """
+        r_id, cx, cy = self._image(image_data, width, height)
+        # The anchor always uses shape id 1, see splice()
+        anchor = PROFILE_IMAGE_ANCHOR_XML.format(cx=cx, cy=cy, graphic=self._graphic(r_id, name, cx, cy))
+        return f'<w:r><w:drawing>{anchor}</w:drawing></w:r>'
+
+    def paragraph(self, *runs: str, style: Optional[str] = None, space_before=None, space_after=None):
+        """
+        Append a w:p with the given runs and paragraph properties.
+        """
+        self.xml.append('<w:p>')
+        self.xml.append(paragraph_properties_xml(style, space_before, space_after))
+        self.xml.extend(runs)
+        self.xml.append('</w:p>')
+
+    def page_break(self):
+        self.xml.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+
+    def section(self, write, key: Optional[str] = None, cache: Optional[SectionCache] = None):
+        """
+        Append a section written by write(), or its XML from the cache when
+        the key is known. The pictures of a cached section must have been
+        registered with image_ref().
+        """
+        xml = cache.get(key) if cache is not None and key is not None else None
+        if cache is not None:
+            profiler.count('section cache hits' if xml is not None else 'section cache misses')
+        if xml is None:
+            start = len(self.xml)
+            write()
+            xml = ''.join(self.xml[start:])
+            del self.xml[start:]
+            if cache is not None and key is not None:
+                cache.put(key, xml)
+        self.xml.append(xml)
+
+    def _resolve(self, xml: str) -> str:
+        # Shape ids continue from the document's, after the anchor's fixed id 1
+        next_shape_id = self.part.next_id
+        if '<wp:anchor' in xml:
+            next_shape_id = max(next_shape_id, 2)
+        r_ids = {}
+
+        def replace(match):
+            nonlocal next_shape_id
+            ref = match.group(1)
+            if ref is None:
+                shape_id = next_shape_id
+                next_shape_id += 1
+                return f'<wp:docPr id="{shape_id}" name="Picture {shape_id}"/>'
+            if ref not in r_ids:
+                r_ids[ref] = self.part.get_or_add_image(io.BytesIO(self._images[ref]))[0]
+            return r_ids[ref]
+        return _PLACEHOLDER_RE.sub(replace, xml)
+
+    def splice(self):
+        """
+        Resolve the placeholders, parse the written content and insert it into
+        the body, before the section properties.
+        """
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+        xml = self._resolve(''.join(self.xml))
+        fragment = parse_xml(f'<w:body {nsdecls("w", "r", "wp", "a", "pic")}>{xml}</w:body>')
+        body = self.doc.element.body
+        index = body.index(body.sectPr) if body.sectPr is not None else len(body)
+        body[index:index] = list(fragment)
+        self.xml = []
+
+def write_body_xml(doc, inputs: RenderInputs, content: Dict, language: str = 'en',
+                   cache: Optional[SectionCache] = None):
+    """
+    Fast render mode: write the same content as add_body() with a BodyWriter
+    and splice it into the document in one pass. With a SectionCache, the XML
+    of every section is stored under a hash of its data, the language and the
+    template, and sections whose data did not change are copied from it.
+    """
+    headers = LANGUAGES[language]['headers']
+    w = BodyWriter(doc, inputs.template.fragments)
+    heading_style = w.style_id('Heading 2')
+    try:
+        bullet_style = w.style_id('List Bullet')
+        bullet_prefix = ''
+    except KeyError:
+        bullet_style, bullet_prefix = None, '• '
+    
+    def add_header(text):
+        w.paragraph(w.run(text, bold=True, caps=True), style=heading_style,
+                    space_before=Pt(6), space_after=Pt(3))
+    
+    def add_bullets(items):
+        for item in items:
+            w.paragraph(w.run(f"{bullet_prefix}{item}"), style=bullet_style, space_after=Pt(0))
+    
+    def add_spacer():
+        w.paragraph(space_after=Pt(6))
+    
+    # Header paragraph: floating image, name and contact lines
+    def write_header():
+        runs = []
+        if inputs.image is not None:
+            runs.append(w.floating_picture(inputs.image, inputs.image_name, width=PROFILE_IMAGE_WIDTH))
+        runs.append(w.fragments.contact_runs)
+        w.paragraph(*runs, space_after=Pt(12))
+    
+    # Profile
+    def write_profile():
+        add_header(content['profile_header'])
+        w.paragraph(w.run(content['profile_text']), space_after=Pt(0))
+        add_spacer()
+    
+    # Key Competencies
+    def write_competencies():
+        add_header(headers['competencies'])
+        add_bullets(content['key_competencies'])
+        add_spacer()
+    
+    # Work Experience
+    def write_work_experience():
+        add_header(headers['work_experience'])
+        for job, (logo_path, logo_data) in zip(content['work_experience'], logos):
+            if job.get('page_break_before', False):
+                w.page_break()
+            
+            runs = []
+            if logo_data:
+                try:
+                    runs.extend((w.picture(logo_data, os.path.basename(logo_path), height=LOGO_HEIGHT), w.run("  ")))
+                except Exception as e:
+                    print(f"  ⚠ Could not add logo for {job['company']}: {e}")
+            runs.append(w.run(job['title'], bold=True))
+            w.paragraph(*runs, space_after=Pt(0))
+            
+            info_parts = [part for part in (job['company'], job['location'], job['date']) if part]
+            w.paragraph(w.run(' | '.join(info_parts) if info_parts else job['date']), space_after=Pt(0))
+            w.paragraph(w.run(job['description']), space_after=Pt(0))
+            w.paragraph(w.run(f"Keywords: {job['keywords']}", italic=True, size=Pt(9)), space_after=Pt(0))
+        add_spacer()
+    
+    # Education
+    def write_education():
+        add_header(headers['education'])
+        for edu in content['education']:
+            runs = [w.run(edu['degree'], bold=True)]
+            if edu['school'] and edu['date']:
+                runs.append(w.run(f", {edu['school']} ({edu['date']})"))
+            elif edu['school']:
+                runs.append(w.run(f", {edu['school']}"))
+            elif edu['date']:
+                runs.append(w.run(f" ({edu['date']})"))
+            w.paragraph(*runs, space_after=Pt(0))
+        add_spacer()
+    
+    # Certificates
+    def write_certificates():
+        w.paragraph(w.run(headers['certificates'], bold=True), space_before=Pt(0), space_after=Pt(3))
+        add_bullets(content['certificates'])
+        add_spacer()
+    
+    # IT Skills
+    def write_it_skills():
+        add_header(headers['skills'])
+        for cat, skills in content['it_skills'].items():
+            w.paragraph(w.run(f"{cat}: ", bold=True), w.run(skills), space_after=Pt(0))
+    
+    # Languages
+    def write_languages():
+        add_header(headers['languages'])
+        add_bullets(content['languages'])
+        add_spacer()
+    
+    # Projects
+    def write_projects():
+        add_header(headers['projects'])
+        for proj in content['projects']:
+            w.paragraph(w.run(proj['name'], bold=True), w.run(f": {proj['desc']}"), space_after=Pt(0))
+        add_spacer()
+    
+    # Pictures are registered up front, a section copied from the cache needs them too
+    logos = []
+    for job in content['work_experience']:
+        logo_path = resolve_logo(inputs.logo_index, job)
+        logo_data = inputs.read_logo(logo_path) if logo_path else None
+        logos.append((logo_path, logo_data))
+    image_ref = w.image_ref(inputs.image) if inputs.image is not None else None
+    logo_refs = [(os.path.basename(path), w.image_ref(data)) if data else None for path, data in logos]
+    
+    sections = [
+        ('Header', write_header, [image_ref, inputs.image_name, w.fragments.contact_runs]),
+        ('Profile', write_profile, [content['profile_header'], content['profile_text']]),
+        ('Key Competencies', write_competencies, [headers['competencies'], content['key_competencies']]),
+        ('Work Experience', write_work_experience, [headers['work_experience'], content['work_experience'], logo_refs]),
+        ('Education', write_education, [headers['education'], content['education']]),
+        ('Certificates', write_certificates, [headers['certificates'], content['certificates']]),
+        ('IT Skills', write_it_skills, [headers['skills'], list(content['it_skills'].items())]),
+        ('Languages', write_languages, [headers['languages'], content['languages']]),
+        ('Projects', write_projects, [headers['projects'], content['projects']])
+    ]
+    for name, write, data in sections:
+        profiler.section(name)
+        key = SectionCache.make_key(name, language, inputs.template.digest, data) if cache is not None else None
+        w.section(write, key, cache)
+    
+    profiler.section('Splice')
+    w.splice()
+
+def add_page_numbers(doc):
+    """
+    Add "page (pages)" number fields to the document header.
+    """
     section = doc.sections[0]
     header = section.header
     header_para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
@@ -1145,8 +2944,920 @@ def create_cv(template_path, output_path, image_path, language='en'):
     # Add ")" text
     header_para.add_run(')')
 
-    doc.save(output_path)
-    print(f"✓ CV saved to {output_path}")
+# Styles the generator applies by name. Styles the prepared template refers to
+# itself, like the one of the page number header, are found by scanning it.
+GENERATOR_STYLES = ['Heading 2', 'List Bullet', 'Hyperlink']
+
+def template_references(doc):
+    """
+    Return the style and numbering ids the XML parts of a document refer to,
+    apart from its style and numbering definitions, and the relationship ids
+    used in its main document part.
+    """
+    from docx.opc.part import XmlPart
+    style_ids, num_ids, r_ids = set(), set(), set()
+    for part in doc.part.package.iter_parts():
+        if not isinstance(part, XmlPart) or part.partname.endswith(('/styles.xml', '/numbering.xml')):
+            continue
+        style_ids.update(part.element.xpath('.//w:pStyle/@w:val | .//w:rStyle/@w:val | .//w:tblStyle/@w:val'))
+        num_ids.update(part.element.xpath('.//w:numPr/w:numId/@w:val'))
+        if part is doc.part:
+            r_ids.update(part.element.xpath('.//@r:id | .//@r:embed | .//@r:link'))
+    return style_ids, num_ids, r_ids
+
+def slim_template(template_path: str, output_path: str) -> Dict:
+    """
+    Write a copy of the template without its sample content and without what
+    no CV uses: styles (and their numbering definitions) that neither the
+    generator nor the prepared template refer to, latent style definitions,
+    unused fonts, media only the sample content showed and the link to the
+    template it was made from. The theme is kept while styles use its fonts
+    or colors. Returns {what: (before, after)} counts and the dropped parts.
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.opc.part import XmlPart
+    from lxml import etree
+    with open(template_path, 'rb') as f:
+        template_bytes = f.read()
+    doc = Document(io.BytesIO(template_bytes))
+    strip_template_sample(doc)
+    related = {rel.reltype: rel.target_part for rel in doc.part.rels.values() if not rel.is_external}
+    
+    # Everything a CV refers to: the generator's styles and a prepared copy of the template
+    used_styles, nums, _ = template_references(PreparedTemplate(template_bytes).document)
+    for name in GENERATOR_STYLES:
+        with contextlib.suppress(KeyError):
+            used_styles.add(doc.styles[name].style_id)
+    
+    styles = doc.styles.element
+    by_id = {style.get(qn('w:styleId')): style for style in styles.findall(qn('w:style'))}
+    keep = used_styles | {style_id for style_id, style in by_id.items() if style.get(qn('w:default')) in ('1', 'true')}
+    numbering = related[RT.NUMBERING].element if RT.NUMBERING in related else None
+    abstract_ids = set()
+    pending = list(keep)
+    while pending:
+        style = by_id.get(pending.pop())
+        if style is not None:
+            for ref in style.xpath('w:basedOn/@w:val | w:next/@w:val | w:link/@w:val'):
+                if ref not in keep:
+                    keep.add(ref)
+                    pending.append(ref)
+            nums.update(style.xpath('w:pPr/w:numPr/w:numId/@w:val'))
+        if not pending and numbering is not None:
+            # Numbering definitions can link back to (numbering) styles
+            for num in numbering.findall(qn('w:num')):
+                if num.get(qn('w:numId')) in nums:
+                    abstract_ids.update(num.xpath('w:abstractNumId/@w:val'))
+            for abstract in numbering.findall(qn('w:abstractNum')):
+                if abstract.get(qn('w:abstractNumId')) in abstract_ids:
+                    refs = abstract.xpath('w:numStyleLink/@w:val | w:styleLink/@w:val | w:lvl/w:pStyle/@w:val')
+                    pending.extend(ref for ref in refs if ref not in keep)
+                    keep.update(refs)
+    
+    summary = {'styles': [len(by_id), 0], 'numbering definitions': [0, 0], 'fonts': [0, 0], 'dropped': []}
+    for style_id, style in by_id.items():
+        if style_id not in keep:
+            styles.remove(style)
+    latent_styles = styles.find(qn('w:latentStyles'))
+    if latent_styles is not None:
+        styles.remove(latent_styles)
+    summary['styles'][1] = len(styles.findall(qn('w:style')))
+    
+    if numbering is not None:
+        summary['numbering definitions'][0] = len(numbering.findall(qn('w:abstractNum')))
+        for num in numbering.findall(qn('w:num')):
+            if num.get(qn('w:numId')) not in nums:
+                numbering.remove(num)
+        for abstract in numbering.findall(qn('w:abstractNum')):
+            if abstract.get(qn('w:abstractNumId')) not in abstract_ids:
+                numbering.remove(abstract)
+        picture_bullets = set(numbering.xpath('w:abstractNum/w:lvl/w:lvlPicBulletId/@w:val'))
+        for bullet in numbering.findall(qn('w:numPicBullet')):
+            if bullet.get(qn('w:numPicBulletId')) not in picture_bullets:
+                numbering.remove(bullet)
+        summary['numbering definitions'][1] = len(numbering.findall(qn('w:abstractNum')))
+    
+    # Images, links, headers and footers only matter while the XML refers to them
+    _, _, r_ids = template_references(doc)
+    for r_id, rel in list(doc.part.rels.items()):
+        if rel.reltype in (RT.IMAGE, RT.HYPERLINK, RT.HEADER, RT.FOOTER) and r_id not in r_ids:
+            summary['dropped'].append(rel.target_ref)
+            del doc.part.rels[r_id]
+    if RT.SETTINGS in related:
+        settings = related[RT.SETTINGS]
+        attached = settings.element.find(qn('w:attachedTemplate'))
+        if attached is not None:
+            summary['dropped'].append('attached template')
+            settings.element.remove(attached)
+            del settings.rels[attached.get(qn('r:id'))]
+    
+    content_parts = [part for part in doc.part.package.iter_parts()
+                     if isinstance(part, XmlPart) and part is not related.get(RT.SETTINGS)]
+    fonts = set()
+    for part in content_parts:
+        fonts.update(part.element.xpath('.//w:rFonts/@w:ascii | .//w:rFonts/@w:hAnsi | .//w:rFonts/@w:eastAsia'
+                                        ' | .//w:rFonts/@w:cs | .//w:sym/@w:font'))
+    theme_used = any(part.element.xpath('.//@*[contains(translate(local-name(), "T", "t"), "theme")]')
+                     for part in content_parts)
+    if RT.THEME in related:
+        if theme_used:
+            fonts.update(etree.fromstring(related[RT.THEME].blob).xpath('//*[local-name() = "fontScheme"]//@typeface'))
+        else:
+            summary['dropped'].append(related[RT.THEME].partname.lstrip('/'))
+            doc.part.drop_rel(next(r_id for r_id, rel in doc.part.rels.items() if rel.reltype == RT.THEME))
+    if RT.FONT_TABLE in related:
+        # python-docx keeps the font table as bytes
+        font_table_part = related[RT.FONT_TABLE]
+        font_table = etree.fromstring(font_table_part.blob)
+        summary['fonts'][0] = len(font_table.findall(qn('w:font')))
+        for font in font_table.findall(qn('w:font')):
+            if font.get(qn('w:name')) not in fonts:
+                font_table.remove(font)
+        summary['fonts'][1] = len(font_table.findall(qn('w:font')))
+        font_table_part._blob = etree.tostring(font_table, xml_declaration=True, encoding='UTF-8', standalone=True)
+    
+    save_docx(doc, output_path)
+    return summary
+
+def report_template_slimming(template_path: str, slim_path: str, image_path: str, summary: Dict,
+                             content: Dict, company_logos: Dict[str, str], repeat: int = 5):
+    """
+    Print what slim_template() removed and compare both templates: package
+    size, parse and prepare time, and the size of a rendered Swedish CV.
+    """
+    def best_of(func) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    
+    print(f"\n✂ Slimmed {os.path.basename(template_path)} → {slim_path}:")
+    for what in ('styles', 'numbering definitions', 'fonts'):
+        before, after = summary[what]
+        print(f"  ✓ {what}: {before} → {after}")
+    if summary['dropped']:
+        print(f"  ✓ dropped: {', '.join(summary['dropped'])}")
+    
+    inputs = RenderInputs(template_path, image_path, company_logos)
+    results = []
+    for path in (template_path, slim_path):
+        with open(path, 'rb') as f:
+            blob = f.read()
+        inputs.template = PreparedTemplate(blob)
+        stream = io.BytesIO()
+        write_docx(build_document(inputs, content, SOURCE_LANGUAGE, fast=True), stream)
+        results.append((len(blob), best_of(lambda: Document(io.BytesIO(blob))),
+                        best_of(lambda: PreparedTemplate(blob).document), len(stream.getvalue())))
+    (size, parse, prepare, output), (slim_size, slim_parse, slim_prepare, slim_output) = results
+    print(f"  ✓ template: {size / 1024:.0f} KB → {slim_size / 1024:.0f} KB")
+    print(f"  ✓ parse: {parse * 1000:.1f} ms → {slim_parse * 1000:.1f} ms, "
+          f"prepare: {prepare * 1000:.1f} ms → {slim_prepare * 1000:.1f} ms")
+    print(f"  ✓ {LANGUAGES[SOURCE_LANGUAGE]['output']}: {output / 1024:.0f} KB → {slim_output / 1024:.0f} KB "
+          f"({slim_output / output - 1:+.0%})")
+    print(f"  Use it with --template {slim_path}")
+
+BUILD_MANIFEST_PATH = os.path.join(CACHE_DIR, 'build-manifest.json')
+
+# Source language of the repository content, other languages depend on translation
+SOURCE_LANGUAGE = 'sv'
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Return the sha256 hex digest of a file's content, or None if it does not exist.
+    """
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def content_digest(language: str, content: Dict) -> str:
+    """
+    Hash everything besides files that the renderer reads for a language: the
+    assembled content (as returned by CVData.for_language, so whatever data
+    tables, fallbacks and translations it was built from), the contact
+    tables, the section headers and the logo aliases.
+    """
+    payload = json.dumps([content, contact_info, contact_links, LANGUAGES[language], LOGO_ALIASES],
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def build_inputs(language: str, content: Dict, template_path: str, image_path: str, image_dpi: int = IMAGE_DPI,
+                 deflate_level: int = DOCX_DEFLATE_LEVEL, build_date: Optional[int] = None) -> Dict[str, Optional[str]]:
+    """
+    Collect content hashes of everything a CV target is generated from,
+    given the content of its language.
+    """
+    inputs = {
+        'template': file_digest(template_path),
+        'image': file_digest(image_path),
+        'image-dpi': str(image_dpi),
+        'deflate-level': str(deflate_level),
+        'build-date': str(build_date),
+        'content': content_digest(language, content)
+    }
+    for name in COMPONENT_FILES:
+        inputs[f'components/{name}'] = file_digest(os.path.join(REPO_ROOT, 'components', name))
+    for logo_file in LOGO_FILES.values():
+        inputs[f'public/{logo_file}'] = file_digest(os.path.join(REPO_ROOT, 'public', logo_file))
+    return inputs
+
+class BuildManifest:
+    """
+    Records the input hashes each generated CV was built from, make-style.
+    A target is up to date when its output still has the recorded hash and
+    none of its inputs changed since it was generated.
+    """
+    VERSION = 1
+
+    def __init__(self, path: str = BUILD_MANIFEST_PATH):
+        self.path = path
+        self.targets = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    payload = json.load(f)
+                if payload.get('version') == self.VERSION:
+                    self.targets = payload.get('targets', {})
+            except (OSError, ValueError) as e:
+                print(f"  ⚠ Ignoring unreadable build manifest: {e}")
+
+    def is_up_to_date(self, output_path: str, inputs: Dict[str, Optional[str]]) -> bool:
+        entry = self.targets.get(os.path.abspath(output_path))
+        if entry is None or entry.get('inputs') != inputs:
+            return False
+        return entry.get('output') == file_digest(output_path)
+
+    def record(self, output_path: str, inputs: Dict[str, Optional[str]]):
+        self.targets[os.path.abspath(output_path)] = {
+            'inputs': inputs,
+            'output': file_digest(output_path)
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'targets': self.targets}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+_worker_inputs = None
+_worker_contents = None
+_worker_fast = False
+
+def _init_render_worker(inputs: RenderInputs, contents: Dict[str, Dict], fast: bool = False,
+                        cache_enabled: bool = True):
+    global _worker_inputs, _worker_contents, _worker_fast
+    _worker_inputs = inputs
+    _worker_contents = contents
+    _worker_fast = fast
+    section_cache.enabled = cache_enabled
+
+def _render_worker(language: str, output_path: str) -> str:
+    render_cv(_worker_inputs, _worker_contents[language], output_path, language, _worker_fast)
+    section_cache.save()
+    return output_path
+
+def render_all(inputs: RenderInputs, contents: Dict[str, Dict], outputs: Dict[str, str], jobs: int = 1,
+               fast: bool = False):
+    """
+    Render every language in contents to its path in outputs.
+    With jobs > 1 the languages are rendered in a process pool; the shared
+    inputs are sent to each worker once when it starts.
+    """
+    if jobs <= 1 or len(outputs) <= 1:
+        for language, output_path in outputs.items():
+            print("\n" + LANGUAGES[language]['label'])
+            render_cv(inputs, contents[language], output_path, language, fast)
+        section_cache.save()
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    print(f"\n⚙ Rendering {len(outputs)} languages with {min(jobs, len(outputs))} workers...")
+    with ProcessPoolExecutor(max_workers=min(jobs, len(outputs)), initializer=_init_render_worker,
+                             initargs=(inputs, contents, fast, section_cache.enabled)) as pool:
+        futures = [pool.submit(_render_worker, language, output_path) for language, output_path in outputs.items()]
+        for future in futures:
+            future.result()
+
+def parse_languages(value: str) -> List[str]:
+    """
+    Parse the --lang argument: 'both', 'all' or a comma-separated list of language codes.
+    """
+    if value in ('both', 'all'):
+        return list(LANGUAGES)
+    languages = [code.strip() for code in value.split(',') if code.strip()]
+    unknown = [code for code in languages if code not in LANGUAGES]
+    if unknown or not languages:
+        import argparse
+        raise argparse.ArgumentTypeError(f"unknown language(s): {', '.join(unknown) or value} (choose from {', '.join(LANGUAGES)})")
+    return languages
+
+# Headless LibreOffice used for --pdf. Every worker gets its own user profile,
+# since instances sharing a profile cannot run at the same time.
+LIBREOFFICE_PROFILE_DIR = os.path.join(CACHE_DIR, 'libreoffice')
+LIBREOFFICE_CANDIDATES = ['soffice', 'libreoffice', '/Applications/LibreOffice.app/Contents/MacOS/soffice']
+PDF_TIMEOUT = 120
+PDF_CONNECT_TIMEOUT = 30
+
+def find_soffice() -> Optional[str]:
+    for candidate in LIBREOFFICE_CANDIDATES:
+        path = shutil.which(candidate)
+        if path:
+            return path
+    return None
+
+class _UnoPdfWorker:
+    """
+    A persistent headless LibreOffice instance driven over UNO; each
+    conversion only loads the document and exports it.
+    """
+
+    def __init__(self, soffice: str, profile_dir: str):
+        import subprocess
+        import uno
+        self.profile_dir = profile_dir
+        self.pipe_name = f"cv-generator-{os.getpid()}-{os.path.basename(profile_dir)}"
+        self.process = subprocess.Popen([
+            soffice, '--headless', '--invisible', '--nologo', '--norestore', '--nodefault', '--nolockcheck',
+            f"-env:UserInstallation={uno.systemPathToFileUrl(os.path.abspath(profile_dir))}",
+            f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            'com.sun.star.bridge.UnoUrlResolver', local_context)
+        deadline = time.monotonic() + PDF_CONNECT_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if time.monotonic() > deadline or self.process.poll() is not None:
+                    self.process.kill()
+                    raise RuntimeError("LibreOffice did not start")
+                time.sleep(0.1)
+        self.desktop = context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+
+    @staticmethod
+    def _properties(**values):
+        from com.sun.star.beans import PropertyValue
+        properties = []
+        for name, value in values.items():
+            prop = PropertyValue()
+            prop.Name = name
+            prop.Value = value
+            properties.append(prop)
+        return tuple(properties)
+
+    def convert(self, docx_path: str, pdf_path: str):
+        import uno
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(docx_path)), '_blank', 0, self._properties(Hidden=True))
+        try:
+            document.storeToURL(uno.systemPathToFileUrl(os.path.abspath(pdf_path)),
+                                self._properties(FilterName='writer_pdf_Export'))
+        finally:
+            document.close(True)
+
+    def close(self):
+        try:
+            self.desktop.terminate()
+        except Exception:
+            pass
+        try:
+            self.process.wait(timeout=10)
+        except Exception:
+            self.process.kill()
+
+class _CliPdfWorker:
+    """
+    Converts with soffice --convert-to when the UNO bridge is not installed.
+    Each conversion starts LibreOffice, but the worker's own profile directory
+    is kept between conversions and runs, so only the first start is cold.
+    """
+
+    def __init__(self, soffice: str, profile_dir: str):
+        self.soffice = soffice
+        self.profile_dir = profile_dir
+
+    def convert(self, docx_path: str, pdf_path: str):
+        import subprocess
+        import tempfile
+        from pathlib import Path
+        out_dir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(pdf_path)))
+        try:
+            result = subprocess.run([
+                self.soffice, '--headless', '--norestore', '--nolockcheck',
+                f"-env:UserInstallation={Path(os.path.abspath(self.profile_dir)).as_uri()}",
+                '--convert-to', 'pdf', '--outdir', out_dir, docx_path
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=PDF_TIMEOUT)
+            produced = os.path.join(out_dir, os.path.splitext(os.path.basename(docx_path))[0] + '.pdf')
+            if result.returncode != 0 or not os.path.exists(produced):
+                raise RuntimeError(result.stderr.decode(errors='replace').strip() or f"exit status {result.returncode}")
+            shutil.move(produced, pdf_path)
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    def close(self):
+        pass
+
+class PdfExporter:
+    """
+    Converts generated CVs to PDF with a pool of headless LibreOffice workers,
+    started on first use and kept until close(), so --watch rebuilds reuse
+    warm instances. Documents are converted concurrently and a PDF is only
+    regenerated when the content hash of its .docx changed.
+    """
+
+    def __init__(self, workers: int = len(LANGUAGES), profile_dir: str = LIBREOFFICE_PROFILE_DIR):
+        self.size = max(1, workers)
+        self.profile_dir = profile_dir
+        self.soffice = find_soffice()
+        self.use_uno = importlib.util.find_spec('uno') is not None
+        self._idle = []
+        self._started = 0
+        self._free_profiles = []
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return self.soffice is not None
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            if self._free_profiles:
+                profile_dir = self._free_profiles.pop()
+            else:
+                self._started += 1
+                profile_dir = os.path.join(self.profile_dir, f'worker-{self._started}')
+        worker_class = _UnoPdfWorker if self.use_uno else _CliPdfWorker
+        os.makedirs(profile_dir, exist_ok=True)
+        return worker_class(self.soffice, profile_dir)
+
+    def _release(self, worker):
+        with self._lock:
+            self._idle.append(worker)
+
+    def _convert(self, docx_path: str, pdf_path: str) -> float:
+        start = time.perf_counter()
+        worker = self._acquire()
+        tmp_path = pdf_path + '.tmp.pdf'
+        try:
+            worker.convert(docx_path, tmp_path)
+        except Exception:
+            # A worker that failed may be in a bad state, start a fresh one next time
+            # with a clean profile in the same slot
+            worker.close()
+            shutil.rmtree(worker.profile_dir, ignore_errors=True)
+            with self._lock:
+                self._free_profiles.append(worker.profile_dir)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._release(worker)
+        os.replace(tmp_path, pdf_path)
+        return time.perf_counter() - start
+
+    def export(self, docx_paths: List[str], manifest: BuildManifest):
+        """
+        Convert every .docx whose PDF is missing or older than its content.
+        """
+        if not self.available:
+            print("\n⚠ LibreOffice not found, skipping PDF export. Install it and make sure soffice is on PATH.")
+            return
+        pending = []
+        for docx_path in docx_paths:
+            pdf_path = os.path.splitext(docx_path)[0] + '.pdf'
+            inputs = {'docx': file_digest(docx_path)}
+            if manifest.is_up_to_date(pdf_path, inputs):
+                print(f"\n✓ {os.path.basename(pdf_path)} is up to date")
+            else:
+                pending.append((docx_path, pdf_path, inputs))
+        if not pending:
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        print(f"\n📄 Exporting {len(pending)} PDFs with {min(self.size, len(pending))} LibreOffice workers"
+              f" ({'UNO' if self.use_uno else 'soffice --convert-to'})...")
+        with profiler.stage('pdf export'), ThreadPoolExecutor(max_workers=min(self.size, len(pending))) as pool:
+            futures = {pool.submit(self._convert, docx_path, pdf_path): (pdf_path, inputs)
+                       for docx_path, pdf_path, inputs in pending}
+            for future, (pdf_path, inputs) in futures.items():
+                try:
+                    elapsed = future.result()
+                except Exception as e:
+                    print(f"  ⚠ Could not export {os.path.basename(pdf_path)}: {e}")
+                    continue
+                manifest.record(pdf_path, inputs)
+                print(f"  ✓ {os.path.basename(pdf_path)} ({elapsed:.1f} s)")
+        manifest.save()
+
+    def close(self):
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.close()
+
+# How often files are checked when inotify is not available, and how long a
+# burst of file system events (an editor saving) is collected before rebuilding
+WATCH_POLL_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.05
+
+_has_inotify = None
+
+def has_inotify() -> bool:
+    """
+    Check once whether inotify_simple is installed, warning if it is not.
+    """
+    global _has_inotify
+    if _has_inotify is None:
+        _has_inotify = importlib.util.find_spec('inotify_simple') is not None
+        if not _has_inotify:
+            print("⚠ inotify_simple not installed. Install with: pip install inotify_simple")
+            print("  Watching files by polling instead.")
+    return _has_inotify
+
+class FileWatcher:
+    """
+    Waits for the content of any of a set of files to change, through inotify
+    when available and by polling size and modification time otherwise.
+    The directories are watched rather than the files, so editors that save
+    by renaming a new file into place are noticed too.
+    poll() checks for changes without blocking and always compares stats.
+    """
+
+    def __init__(self, paths: List[str], interval: float = WATCH_POLL_INTERVAL, use_inotify: bool = True):
+        self.paths = sorted({os.path.abspath(path) for path in paths})
+        self.interval = interval
+        self.digests = {path: file_digest(path) for path in self.paths}
+        self._stats = {path: self._stat(path) for path in self.paths}
+        self._inotify = None
+        if use_inotify and has_inotify():
+            from inotify_simple import INotify, flags
+            try:
+                self._inotify = INotify()
+                mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE
+                self._directories = {
+                    self._inotify.add_watch(directory, mask): directory
+                    for directory in {os.path.dirname(path) for path in self.paths}
+                }
+            except OSError as e:
+                print(f"⚠ inotify is not available ({e}), watching files by polling instead")
+                self._inotify = None
+        self.mode = 'inotify' if self._inotify else 'polling'
+
+    @staticmethod
+    def _stat(path: str):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _wait_inotify(self) -> set:
+        candidates = set()
+        events = self._inotify.read()
+        while events:
+            for event in events:
+                path = os.path.join(self._directories.get(event.wd, ''), event.name)
+                if path in self.digests:
+                    candidates.add(path)
+            events = self._inotify.read(timeout=int(WATCH_DEBOUNCE * 1000))
+        return candidates
+
+    def _stat_changes(self) -> set:
+        candidates = {path for path in self.paths if self._stat(path) != self._stats[path]}
+        for path in candidates:
+            self._stats[path] = self._stat(path)
+        return candidates
+
+    def _wait_poll(self) -> set:
+        while True:
+            time.sleep(self.interval)
+            if any(self._stat(path) != self._stats[path] for path in self.paths):
+                time.sleep(WATCH_DEBOUNCE)
+                return self._stat_changes()
+
+    def _content_changes(self, candidates: set) -> List[str]:
+        changed = []
+        for path in sorted(candidates):
+            digest = file_digest(path)
+            if digest != self.digests[path]:
+                self.digests[path] = digest
+                changed.append(path)
+        return changed
+
+    def poll(self) -> List[str]:
+        """
+        Return the files whose content changed since the last check, without waiting.
+        """
+        return self._content_changes(self._stat_changes())
+
+    def wait(self) -> List[str]:
+        """
+        Block until at least one file has different content and return those files.
+        """
+        while True:
+            candidates = self._wait_inotify() if self._inotify else self._wait_poll()
+            changed = self._content_changes(candidates)
+            if changed:
+                return changed
+
+class WarmInputs:
+    """
+    CV content and render inputs kept in memory by long-running modes (--watch
+    and --serve). The parsed template, images, extracted content and
+    translation cache stay resident; refresh() only reads changed files again.
+    """
+
+    def __init__(self, cv_data: CVData, template_path: str, image_path: str, image_dpi: int = IMAGE_DPI,
+                 render_inputs: Optional[RenderInputs] = None, deflate_level: int = DOCX_DEFLATE_LEVEL,
+                 build_date: Optional[int] = None):
+        self.cv_data = cv_data
+        self.template_path = os.path.abspath(template_path)
+        self.image_path = os.path.abspath(image_path)
+        self.image_dpi = image_dpi
+        self.deflate_level = deflate_level
+        self.build_date = build_date
+        self._render_inputs = render_inputs
+        self.components_dir = os.path.abspath(os.path.join(cv_data.repo_root, 'components'))
+        self.public_dir = os.path.abspath(os.path.join(cv_data.repo_root, 'public'))
+
+    @property
+    def render_inputs(self) -> RenderInputs:
+        if self._render_inputs is None:
+            self._render_inputs = RenderInputs(self.template_path, self.image_path, self.cv_data.company_logos,
+                                               self.image_dpi, deflate_level=self.deflate_level,
+                                               build_date=self.build_date)
+        return self._render_inputs
+
+    def watched_paths(self) -> List[str]:
+        paths = [os.path.join(self.components_dir, name) for name in COMPONENT_FILES]
+        paths += [os.path.join(self.public_dir, logo_file) for logo_file in LOGO_FILES.values()]
+        return paths + [self.template_path, self.image_path]
+
+    def refresh(self, changed: List[str]) -> bool:
+        """
+        Update the in-memory state for the changed files. Returns whether the
+        template, image or logos changed, i.e. every document is affected.
+        """
+        components = [os.path.basename(path) for path in changed if os.path.dirname(path) == self.components_dir]
+        logos_changed = any(os.path.dirname(path) == self.public_dir for path in changed)
+        template_changed = self.template_path in changed
+        assets_changed = logos_changed or template_changed or self.image_path in changed
+        
+        if components or logos_changed:
+            self.cv_data.reload(components, logos=logos_changed)
+        if assets_changed and self._render_inputs is not None:
+            # The parsed template is kept unless the template itself changed
+            template = None if template_changed else self._render_inputs.template
+            self._render_inputs = RenderInputs(self.template_path, self.image_path, self.cv_data.company_logos,
+                                               self.image_dpi, template=template, deflate_level=self.deflate_level,
+                                               build_date=self.build_date)
+        return assets_changed
+
+class WatchSession:
+    """
+    Rebuilds CVs whenever their source files change (--watch). State is kept
+    warm in a WarmInputs, so a rebuild only reads the changed files again and
+    only re-renders the languages whose content or assets changed.
+    """
+
+    def __init__(self, state: WarmInputs, manifest: BuildManifest, languages: List[str], output_dir: str,
+                 jobs: int = 1, fast: bool = False, pdf: Optional[PdfExporter] = None):
+        self.state = state
+        self.pdf = pdf
+        self.manifest = manifest
+        self.languages = languages
+        self.output_dir = output_dir
+        self.jobs = jobs
+        self.fast = fast
+        self.contents = {language: state.cv_data.for_language(language) for language in languages}
+
+    def rebuild(self, changed: List[str]) -> List[str]:
+        """
+        Update the warm state for the changed files and re-render the affected
+        languages. Returns the languages that were rendered.
+        """
+        global translation_failures
+        translation_failures = 0
+        assets_changed = self.state.refresh(changed)
+        
+        outputs = {}
+        for language in self.languages:
+            output_path = os.path.join(self.output_dir, LANGUAGES[language]['output'])
+            content = self.state.cv_data.for_language(language)
+            if assets_changed or content != self.contents[language] or not os.path.exists(output_path):
+                outputs[language] = output_path
+            self.contents[language] = content
+        if outputs:
+            render_all(self.state.render_inputs, self.contents, outputs, jobs=self.jobs, fast=self.fast)
+        
+        # Languages that were not re-rendered already match their new inputs
+        for language in self.languages:
+            if language == SOURCE_LANGUAGE or translation_failures == 0:
+                output_path = os.path.join(self.output_dir, LANGUAGES[language]['output'])
+                self.manifest.record(output_path, build_inputs(language, self.contents[language],
+                                                               self.state.template_path, self.state.image_path,
+                                                               self.state.image_dpi, self.state.deflate_level,
+                                                               self.state.build_date))
+        self.manifest.save()
+        if self.pdf is not None and outputs:
+            self.pdf.export(list(outputs.values()), self.manifest)
+        return list(outputs)
+
+    def run(self):
+        """
+        Watch the source files and rebuild on every change until interrupted.
+        """
+        watcher = FileWatcher(self.state.watched_paths())
+        print(f"\n👀 Watching {len(watcher.paths)} files for changes ({watcher.mode}), press Ctrl+C to stop")
+        while True:
+            changed = watcher.wait()
+            start = time.perf_counter()
+            print("\n✎ Changed: " + ', '.join(os.path.relpath(path, REPO_ROOT) for path in changed))
+            rendered = self.rebuild(changed)
+            elapsed = (time.perf_counter() - start) * 1000
+            if rendered:
+                print(f"✓ Rebuilt {', '.join(LANGUAGES[language]['output'] for language in rendered)} in {elapsed:.0f} ms")
+            else:
+                print(f"✓ CV content unchanged, nothing to rebuild ({elapsed:.0f} ms)")
+
+# Rendered documents kept in memory by --serve
+SERVE_CACHE_ENTRIES = 16
+DOCX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+class _PendingRender:
+    """
+    A document being rendered by one request, which others for it wait on.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.document = None
+
+class RenderService:
+    """
+    Renders CVs on request from warm inputs (--serve). Documents are kept in
+    an LRU cache keyed on a hash of the language's content and the assets,
+    which doubles as ETag. Repeated requests are answered from memory and an
+    edit only invalidates the languages whose content it changes. Renders run
+    outside the lock, so they never hold up requests for other documents;
+    concurrent requests for a document that is being rendered wait for it.
+    """
+
+    def __init__(self, state: WarmInputs, fast: bool = False, max_entries: int = SERVE_CACHE_ENTRIES):
+        self.state = state
+        self.fast = fast
+        self.max_entries = max_entries
+        self.watcher = FileWatcher(state.watched_paths(), use_inotify=False)
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._keys = {}
+        self._rendering = {}
+        self._lock = threading.Lock()
+
+    def _key(self, language: str) -> str:
+        if language not in self._keys:
+            # Component files only matter through the content they produce
+            assets = {os.path.basename(path): digest for path, digest in self.watcher.digests.items()
+                      if os.path.dirname(path) != self.state.components_dir}
+            payload = json.dumps({
+                'language': language,
+                'fast': self.fast,
+                'content': self.state.cv_data.for_language(language),
+                'assets': assets
+            }, sort_keys=True, ensure_ascii=False)
+            self._keys[language] = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+        return self._keys[language]
+
+    def get(self, language: str):
+        """
+        Return (key, document bytes) for a language, rendering it if it is not cached.
+        """
+        with self._lock:
+            changed = self.watcher.poll()
+            if changed:
+                print("\n✎ Changed: " + ', '.join(os.path.relpath(path, REPO_ROOT) for path in changed))
+                self.state.refresh(changed)
+                self._keys.clear()
+            key = self._key(language)
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                return key, self.cache[key]
+            pending = self._rendering.get(key)
+            if pending is None:
+                # This request renders the document, from the inputs the key was computed from
+                pending = self._rendering[key] = _PendingRender()
+                self.misses += 1
+                inputs = self.state.render_inputs
+                content = self.state.cv_data.for_language(language)
+            else:
+                inputs = None
+        
+        if inputs is None:
+            pending.done.wait()
+            if pending.document is None:
+                # The render failed, try again
+                return self.get(language)
+            with self._lock:
+                self.hits += 1
+            return key, pending.document
+        
+        try:
+            start = time.perf_counter()
+            stream = io.BytesIO()
+            doc = build_document(inputs, content, language, self.fast, cache=section_cache)
+            write_docx(doc, stream, inputs.deflate_level, inputs.build_date)
+            section_cache.save()
+            pending.document = stream.getvalue()
+            with self._lock:
+                self.cache[key] = pending.document
+                while len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
+            print(f"✓ Rendered {LANGUAGES[language]['output']} in {(time.perf_counter() - start) * 1000:.0f} ms")
+            return key, pending.document
+        finally:
+            with self._lock:
+                del self._rendering[key]
+            pending.done.set()
+
+def make_server(service: RenderService, host: str = '127.0.0.1', port: int = 8000):
+    """
+    Create a threaded HTTP server answering GET /cv?lang=<code> from a RenderService.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    class CVRequestHandler(BaseHTTPRequestHandler):
+        server_version = 'CVGenerator/1.0'
+        # Keep connections open between requests
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self.respond(send_body=True)
+
+        def do_HEAD(self):
+            self.respond(send_body=False)
+
+        def respond(self, send_body: bool):
+            url = urlsplit(self.path)
+            if url.path != '/cv':
+                self.send_error(404, "Only /cv?lang=<code> is served")
+                return
+            language = parse_qs(url.query).get('lang', ['en'])[0]
+            if language not in LANGUAGES:
+                self.send_error(400, f"Unknown language {language!r} (choose from {', '.join(LANGUAGES)})")
+                return
+            try:
+                key, document = service.get(language)
+            except Exception as e:
+                print(f"⚠ Rendering {language} failed: {e}")
+                self.send_error(500, "Rendering the CV failed")
+                return
+            
+            etag = f'"{key}"'
+            if_none_match = [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]
+            if etag in if_none_match or '*' in if_none_match:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', DOCX_CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(document)))
+            self.send_header('Content-Disposition', f'attachment; filename="{LANGUAGES[language]["output"]}"')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            if send_body:
+                self.wfile.write(document)
+
+        def log_message(self, format, *args):
+            # Renders and changes are reported by the service, not every request
+            pass
+
+    return ThreadingHTTPServer((host, port), CVRequestHandler)
+
+def serve(service: RenderService, host: str = '127.0.0.1', port: int = 8000):
+    """
+    Serve CVs from a RenderService until interrupted.
+    """
+    server = make_server(service, host, port)
+    print(f"\n🌐 Serving CVs on http://{host}:{server.server_port}/cv?lang={'|'.join(LANGUAGES)}, press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        print(f"✓ Served {service.hits + service.misses} documents ({service.hits} from cache)")
 
 if __name__ == "__main__":
     import argparse
@@ -1162,25 +3873,152 @@ if __name__ == "__main__":
                        help='Path to profile image')
     parser.add_argument('--output-dir', default=script_dir,
                        help='Directory to save CVs')
-    parser.add_argument('--lang', choices=['sv', 'en', 'both'], default='both',
-                       help='Language(s) to generate: sv, en, or both')
+    parser.add_argument('--lang', type=parse_languages, default='both',
+                       help='Language(s) to generate: sv, en, a comma-separated list, or both')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of worker processes rendering languages in parallel')
+    parser.add_argument('--image-dpi', type=int, default=IMAGE_DPI,
+                       help='Resolution images are downsampled to for their printed size (0 embeds originals)')
+    parser.add_argument('--deflate-level', type=int, choices=range(10), default=DOCX_DEFLATE_LEVEL, metavar='0-9',
+                       help='Compression level of the XML parts in the .docx (0 stores them uncompressed)')
+    parser.add_argument('--reproducible', action='store_true',
+                       help='Write identical bytes for identical inputs, dated at SOURCE_DATE_EPOCH or 1980-01-01 '
+                            '(implied when SOURCE_DATE_EPOCH is set)')
+    parser.add_argument('--no-translation-cache', action='store_true',
+                       help='Bypass the on-disk translation cache and translate every string again')
+    parser.add_argument('--offline', action='store_true',
+                       help='Translate from the glossary and translation cache only, never the network')
+    parser.add_argument('--translation-deadline', type=float, default=TRANSLATION_DEADLINE, metavar='SECONDS',
+                       help='Seconds all translator calls of a run may take before the rest fall back to Swedish')
+    parser.add_argument('--translation-timeout', type=float, default=TRANSLATION_CALL_TIMEOUT, metavar='SECONDS',
+                       help='Seconds a single translator call may take')
+    parser.add_argument('--glossary', metavar='FILE',
+                       help='JSON file of {"Swedish term": "English translation"} entries added to the glossary')
+    parser.add_argument('--no-section-cache', action='store_true',
+                       help='With --fast, write every section again instead of reusing the cached XML of unchanged ones')
+    parser.add_argument('--force', action='store_true',
+                       help='Regenerate CVs even when none of their inputs changed')
+    parser.add_argument('--fast', action='store_true',
+                       help='Write the document body as XML in one pass instead of through python-docx objects')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--watch', action='store_true',
+                      help='Keep running and rebuild the CVs whenever a component, logo, the template or image changes')
+    mode.add_argument('--serve', action='store_true',
+                      help='Run a local HTTP server rendering CVs on GET /cv?lang=<code> instead of writing files')
+    mode.add_argument('--slim-template', nargs='?', const='', metavar='OUTPUT',
+                      help='Write a copy of the template without the styles, numbering, fonts and parts no CV uses '
+                           '(default: <template>-slim.docx) and report the savings')
+    parser.add_argument('--pdf', action='store_true',
+                       help='Also export the generated CVs to PDF with a pool of headless LibreOffice workers')
+    parser.add_argument('--pdf-workers', type=int, default=len(LANGUAGES),
+                       help='Number of LibreOffice workers converting PDFs concurrently')
+    parser.add_argument('--host', default='127.0.0.1',
+                       help='Address the --serve server listens on')
+    parser.add_argument('--port', type=int, default=8000,
+                       help='Port the --serve server listens on')
+    parser.add_argument('--profile', nargs='?', const=PROFILE_PATH, metavar='TRACE',
+                       help='Record per-stage timings, counters and peak memory to a JSON trace '
+                            f'(default: {os.path.relpath(PROFILE_PATH, script_dir)})')
+    parser.add_argument('--cprofile', metavar='FILE',
+                       help='With --profile, also write cProfile stats (for snakeviz, flameprof or gprof2dot)')
     
     args = parser.parse_args()
+    if args.profile:
+        profiler.start(cprofile=bool(args.cprofile))
+        if args.jobs > 1:
+            # Stages in worker processes would not be recorded
+            print("⚠ --profile renders in this process, ignoring --jobs")
+            args.jobs = 1
     
     print("\n" + "="*60)
     print("  CV GENERATOR - Multi-language Edition")
     print("="*60)
     
-    if args.lang in ['sv', 'both']:
-        print("\n🇸🇪 Generating Swedish CV...")
-        output_sv = os.path.join(args.output_dir, 'Daniel_Hansson_CV_2025_SV.docx')
-        create_cv(args.template, output_sv, args.image, language='sv')
+    translation_cache.enabled = not args.no_translation_cache
+    section_cache.enabled = not args.no_section_cache
+    build_date = source_date_epoch()
+    if build_date is None and args.reproducible:
+        build_date = REPRODUCIBLE_EPOCH
+    translation_breaker.deadline = args.translation_deadline
+    translation_breaker.call_timeout = args.translation_timeout
+    if args.glossary:
+        load_glossary(args.glossary)
+    cv_data = CVData(translator_factory=offline_translator_factory if args.offline else None)
+    
+    if args.slim_template is not None:
+        slim_path = args.slim_template or os.path.splitext(args.template)[0] + '-slim.docx'
+        summary = slim_template(args.template, slim_path)
+        # The Swedish content needs no translation
+        sample = CVData(translator_factory=offline_translator_factory)
+        report_template_slimming(args.template, slim_path, args.image, summary,
+                                 sample.for_language(SOURCE_LANGUAGE), sample.company_logos)
+        sys.exit(0)
+    
+    if args.serve:
+        # Documents are rendered per request, the output directory is not touched
+        state = WarmInputs(cv_data, args.template, args.image, args.image_dpi, deflate_level=args.deflate_level,
+                           build_date=build_date)
+        # Load the content and parse the template before the first request
+        state.render_inputs.template.document
+        try:
+            serve(RenderService(state, fast=args.fast), args.host, args.port)
+        except KeyboardInterrupt:
+            print("\n✓ Stopped serving")
+        if args.profile:
+            profiler.finish(args.profile, args.cprofile)
+        sys.exit(0)
+    
+    manifest = BuildManifest()
+    stale = []
+    with profiler.stage('check manifest'):
+        for language in args.lang:
+            filename = LANGUAGES[language]['output']
+            output_path = os.path.join(args.output_dir, filename)
+            inputs = build_inputs(language, cv_data.for_language(language), args.template, args.image,
+                                  args.image_dpi, args.deflate_level, build_date)
+            if not args.force and manifest.is_up_to_date(output_path, inputs):
+                print(f"\n✓ {filename} is up to date")
+            else:
+                stale.append((language, output_path, inputs))
+    
+    render_inputs = None
+    if stale:
+        # Shared inputs are loaded and translated once, then handed to every render
+        render_inputs = RenderInputs(args.template, args.image, cv_data.company_logos, args.image_dpi,
+                                     deflate_level=args.deflate_level, build_date=build_date)
+        render_inputs.report_image_savings()
+        contents = {language: cv_data.for_language(language) for language, _, _ in stale}
+        render_all(render_inputs, contents, {language: path for language, path, _ in stale}, jobs=args.jobs, fast=args.fast)
+        
+        for language, output_path, inputs in stale:
+            # Untranslated output must be rebuilt once the translator is reachable again
+            if language == SOURCE_LANGUAGE or translation_failures == 0:
+                manifest.record(output_path, inputs)
+        manifest.save()
     
-    if args.lang in ['en', 'both']:
-        print("\n🇬🇧 Generating English CV...")
-        output_en = os.path.join(args.output_dir, 'Daniel_Hansson_CV_2025_ENG.docx')
-        create_cv(args.template, output_en, args.image, language='en')
+    pdf_exporter = PdfExporter(args.pdf_workers) if args.pdf else None
+    if pdf_exporter is not None:
+        pdf_exporter.export([os.path.join(args.output_dir, LANGUAGES[language]['output']) for language in args.lang],
+                            manifest)
     
     print("\n" + "="*60)
     print("  ✓ CV Generation Complete!")
+    if translation_failures:
+        print(f"  ⚠ {translation_failures} strings degraded to untranslated text, "
+              "the English CV is rebuilt on the next run")
     print("="*60)
+    
+    if args.watch:
+        state = WarmInputs(cv_data, args.template, args.image, args.image_dpi, render_inputs, args.deflate_level,
+                           build_date)
+        session = WatchSession(state, manifest, args.lang, args.output_dir, jobs=args.jobs, fast=args.fast,
+                               pdf=pdf_exporter if pdf_exporter is not None and pdf_exporter.available else None)
+        try:
+            session.run()
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+    if pdf_exporter is not None:
+        pdf_exporter.close()
+    
+    if args.profile:
+        profiler.finish(args.profile, args.cprofile)